@@ -3,23 +3,56 @@ AI Monitoring Module
 Collects metrics -> Analyze -> Suggest Fixes -> Execute with confirmation (ideally)
 """
 
+import asyncio
 import json
+import re
+import selectors
+import shlex
+import signal
 import subprocess
-from typing import Dict, List, Optional, Tuple, Any
+import tempfile
+import threading
+import time
+from pathlib import Path
+from collections import deque
+from contextlib import contextmanager, suppress
+from typing import Deque, Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
-from dotenv import load_dotenv
 import os
 
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain.memory import ConversationBufferWindowMemory
-from langchain.schema import SystemMessage, HumanMessage
+import orjson
 from rich.console import Console
-from rich.prompt import Confirm
+from rich.live import Live
+from rich.prompt import Confirm, Prompt
 from rich.panel import Panel
+from rich.table import Table
 
-load_dotenv()
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+from .. import app
+
+# line markers kept by the CONCISE verbosity
+CONCISE_KEYS = ("SUMMARY:", "CRITICAL:", "ACTION:")
+CONCISE_MAX_LINES = 3
+
+# langchain and dotenv are imported lazily, importing langchain alone takes hundreds of ms
+
+
+@contextmanager
+def interruptible_prompt():
+    """
+    asyncio.run swaps the SIGINT handler for one that only cancels the main task,
+    which a prompt blocked in input() never notices. The default handler is put
+    back while prompting so Ctrl-C raises KeyboardInterrupt right away
+    """
+    if threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    previous = signal.signal(signal.SIGINT, signal.default_int_handler)
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGINT, previous)
 
 
 class DataFormat(Enum):
@@ -90,41 +123,139 @@ class MetricCollector:
     then store it in a snap shot and use it for our AI to analyze
     """
 
+    # raw views for the LLM, run concurrently since top -bn1 alone takes a while
+    RAW_CMDS = [
+        "uptime",
+        "free -m",
+        "df -h",
+        "top -bn1",
+    ]
+    # top is trimmed to its summary and the first few processes
+    RAW_TOP_LINES = 20
+
+    @staticmethod
+    def run_cmds(cmds: List[str], timeout: float = 5) -> List[str]:
+        """
+        Run commands side by side and return their stripped outputs in order
+        One selector watches every stdout pipe, so no thread is spawned per command
+        Commands that fail to start or miss the deadline give ""
+        """
+        sel = selectors.DefaultSelector()
+        procs: List[Optional[subprocess.Popen]] = []
+        chunks: List[List[bytes]] = [[] for _ in cmds]
+        for i, cmd in enumerate(cmds):
+            try:
+                proc = subprocess.Popen(
+                    shlex.split(cmd), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+                )
+            except (OSError, ValueError):
+                procs.append(None)
+                continue
+            procs.append(proc)
+            sel.register(proc.stdout, selectors.EVENT_READ, i)
+
+        deadline = time.monotonic() + timeout
+        while sel.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _ in sel.select(remaining):
+                data = os.read(key.fd, 65536)
+                if data:
+                    chunks[key.data].append(data)
+                else:
+                    sel.unregister(key.fileobj)
+
+        # whatever is still registered timed out
+        timed_out = {key.data for key in sel.get_map().values()}
+        sel.close()
+
+        outputs = []
+        for i, proc in enumerate(procs):
+            if proc is None:
+                outputs.append("")
+                continue
+            if i in timed_out:
+                proc.kill()
+            proc.wait()
+            proc.stdout.close()
+            if i in timed_out:
+                outputs.append("")
+            else:
+                outputs.append(b"".join(chunks[i]).decode(errors="replace").strip())
+
+        return outputs
+
+    def run_raw_cmds(self) -> List[str]:
+        """Run RAW_CMDS side by side, top -bn1 alone takes a while"""
+        return self.run_cmds(self.RAW_CMDS)
+
+    def attach_raw(self, snapshot: SystemSnapshot, raw: List[str]) -> None:
+        """Store the RAW_CMDS outputs on the snapshot"""
+        snapshot.raw_uptime, snapshot.raw_free, snapshot.raw_df, top = raw
+        snapshot.raw_top = "\n".join(top.splitlines()[: self.RAW_TOP_LINES])
+
+    # snapshots younger than this many seconds are reused instead of re-collected
+    CACHE_TTL = 3.0
+
     @staticmethod
-    def run_cmd(cmd: str) -> str:
-        """Execute shell commands and return stripped output"""
+    def cache_path(include_raw: bool) -> Path:
+        """Snapshot cache file, separate per user and per include_raw setting"""
+        suffix = "_raw" if include_raw else ""
+        return (
+            Path(tempfile.gettempdir()) / f"surge_snapshot_{os.getuid()}{suffix}.json"
+        )
+
+    def load_cached(self, include_raw: bool) -> Optional[SystemSnapshot]:
+        """
+        Returns the cached snapshot if it is still fresh, otherwise None
+        The temp dir is shared, so a file some other user planted there is ignored
+        """
+        path = self.cache_path(include_raw)
         try:
-            result = subprocess.run(
-                cmd, shell=True, capture_output=True, text=True, timeout=5
-            )
+            fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+            with os.fdopen(fd) as f:
+                st = os.fstat(fd)
+                if st.st_uid != os.getuid():
+                    return None
+                if time.time() - st.st_mtime >= self.CACHE_TTL:
+                    return None
+
+                return SystemSnapshot(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def save_cached(self, snapshot: SystemSnapshot, include_raw: bool) -> None:
+        """Atomically writes the snapshot cache so readers never see a partial file"""
+        path = self.cache_path(include_raw)
+        try:
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}")
+        except OSError:
+            # caching is best effort, a failed write just means collecting next time
+            return
 
-            return result.stdout.strip()
-        except Exception:
-            # When testing I'll see what exactly the error is then isolate it with correct error exceptons
-            pass
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(asdict(snapshot), f)
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError):
+            # e.g. EPERM replacing a cache file owned by someone else, the temp
+            # file would otherwise be left behind in the shared temp dir
+            with suppress(OSError):
+                os.unlink(tmp)
 
     def collect(self, include_raw: bool = False) -> SystemSnapshot:
         """Collecting current system metrics"""
 
-        # getting the strcutured data
-        uptime_raw = self.run_cmd("uptime")
-        # using awk to pattern search for 'average' and output the value $2
-        load_str = self.run_cmd("uptime | awk -F'average:' '{print $2}'")
-        load_avg = [float(x.strip(",")) for x in load_str.split()]
-
-        # Number of cpu cores
-        cores = int(self.run_cmd("nproc"))
-        # memory information
-        mem_info = self.run_cmd("free -m | grep Mem").split()
-        memory = {
-            "total": int(mem_info[1]),
-            "used": int(mem_info[2]),
-            "free": int(mem_info[3]),
-        }
+        cached = self.load_cached(include_raw)
+        if cached is not None:
+            return cached
 
-        # disk information
-        disk_info = self.run_cmd("df -h / | tail -1").split()
-        disk_percent = float(disk_info[4].strip("%"))
+        # the same procfs/statvfs getters the monitor command uses, no processes spawned
+        load_avg, cores = app.get_load()
+        total, used, free = app.get_memory()
+        memory = {"total": total, "used": used, "free": free}
+        disk_percent = app.get_disk()[3]
 
         # create the snapshot
         snapshot = SystemSnapshot(
@@ -136,14 +267,32 @@ class MetricCollector:
 
         # if we want to check out the raw output we can just set that to true when calling it
         if include_raw:
-            snapshot.raw_uptime = uptime_raw
-            snapshot.raw_free = self.run_cmd("free -m")
-            snapshot.raw_df = self.run_cmd("df -h")
-            snapshot.raw_top = self.run_cmd("top -bn1 | head -20")
+            self.attach_raw(snapshot, self.run_raw_cmds())
+
+        self.save_cached(snapshot, include_raw)
 
         # otherwise we'll just return the snapshot we got
         return snapshot
 
+    async def collect_async(self, include_raw: bool = False) -> SystemSnapshot:
+        """Same as collect, but the structured reads and raw commands all run concurrently"""
+        if not include_raw:
+            return await asyncio.to_thread(self.collect)
+
+        cached = self.load_cached(include_raw)
+        if cached is not None:
+            return cached
+
+        snapshot, raw = await asyncio.gather(
+            asyncio.to_thread(self.collect),
+            asyncio.to_thread(self.run_raw_cmds),
+        )
+        self.attach_raw(snapshot, raw)
+
+        self.save_cached(snapshot, include_raw)
+
+        return snapshot
+
 
 class CommandExecutor:
     """
@@ -176,37 +325,104 @@ class CommandExecutor:
         "top -bn1",
     ]
 
+    SHELL_METACHARACTERS = re.compile(r"[|&;<>()$`\n]")
+
+    # diagnostics as argv prefixes, a command must start with one of them exactly
+    DIAGNOSTICS_ARGV = tuple(tuple(cmd.split()) for cmd in DIAGNOSTICS_COMMANDS)
+
+    # options that make an otherwise read-only diagnostic change state (journalctl)
+    DIAGNOSTICS_WRITE_FLAGS = (
+        "--vacuum",
+        "--rotate",
+        "--flush",
+        "--sync",
+        "--relinquish-var",
+        "--smart-relinquish-var",
+        "--setup-keys",
+        "--update-catalog",
+    )
+
     def __init__(self, console: Console):
         self.console = console
 
     def is_diagnostic_command(self, command: str) -> bool:
-        """Checking if the command is part of what we have in the diagnostics commands"""
-        return any(cmd in command for cmd in self.DIAGNOSTICS_COMMANDS)
+        """
+        Checking if the command is part of what we have in the diagnostics commands
+        Its leading argv tokens have to match an entry, so "sudo ..." or a path that
+        merely contains "df" doesn't count
+        """
+        try:
+            argv = shlex.split(command)
+        except ValueError:
+            return False
+
+        if any(arg.startswith(self.DIAGNOSTICS_WRITE_FLAGS) for arg in argv):
+            return False
+
+        return any(
+            tuple(argv[: len(prefix)]) == prefix for prefix in self.DIAGNOSTICS_ARGV
+        )
 
-    def execute(self, command: str, require_confirm: bool = True) -> Tuple[bool, str]:
+    # seconds a fix or diagnostic may run before it is killed
+    TIMEOUT = 30
+
+    async def execute(
+        self, command: str, require_confirm: bool = True
+    ) -> Tuple[bool, str]:
         """
         Execution of the command from LLM with user confirmation
 
         Usage:
             LLM will analyze our metrics and come up with some sort of solution that allows actionable cmds
             Thus user can check the command and confirm with LLM to give consent to action those cmds
+
+        Runs as an asyncio subprocess instead of in a worker thread, so Ctrl-C
+        cancels it right away and the child is killed instead of waited on
         """
 
+        # LLM output never reaches a shell, except for the known fixes that need one
+        use_shell = command in self.FIX_COMMANDS
+        if not use_shell and self.SHELL_METACHARACTERS.search(command):
+            return False, "Rejected: shell operators are not allowed in commands"
+
         if not self.is_diagnostic_command(command):
             if require_confirm:
                 self.console.print(f"[yellow]Command: {command}[/yellow]")
-                if not Confirm.ask("Execute this fix?"):
+                with interruptible_prompt():
+                    confirmed = Confirm.ask("Execute this fix?")
+                if not confirmed:
                     return False, "Cancelled by user"
 
         try:
-            result = subprocess.run(
-                command, shell=True, capture_output=True, text=True, timeout=30
-            )
+            if use_shell:
+                proc = await asyncio.create_subprocess_shell(
+                    command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
+            else:
+                proc = await asyncio.create_subprocess_exec(
+                    *shlex.split(command),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
+        except (OSError, ValueError) as err:
+            return False, f"Error is: {err}"
 
-            return result.returncode == 0, result.stdout
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), self.TIMEOUT)
+        except asyncio.TimeoutError:
+            return (
+                False,
+                f"Error is: '{command}' timed out after {self.TIMEOUT} seconds",
+            )
+        finally:
+            # timed out or cancelled, either way the command doesn't outlive us
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
 
-        except Exception as err:
-            return False, str("Error is: ", err)
+        return proc.returncode == 0, stdout.decode(errors="replace")
 
 
 class AIMonitor:
@@ -233,30 +449,51 @@ class AIMonitor:
     ONLY suggest fixes if there are actual problems.
     """
 
+    STRUCTURED_HEADER = "System Metrics:\n"
+
+    # read-only diagnostics that may run at the same time in run_fixes
+    MAX_CONCURRENT_DIAGNOSTICS = 4
+
+    # lines starting with $ or sudo, or mentioning systemctl
+    COMMAND_LINE_RE = re.compile(r"^[^\S\n]*(\$.*|sudo.*|.*systemctl.*)$", re.MULTILINE)
+
     def __init__(
         self,
         data_format: DataFormat = DataFormat.HYBRID,
         verbosity: Verbosity = Verbosity.NORMAL,
         memory_window: int = 3,
+        console: Optional[Console] = None,
     ):
-        self.console = Console()
+        self.console = console or Console()
         self.data_format = data_format
         self.verbosity = verbosity
 
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
         # calling in the LLM
         self.llm = ChatGoogleGenerativeAI(
-            model="gemini-2.5-flash", google_api_key=GEMINI_API_KEY, temperature=0.1
+            model="gemini-2.5-flash",
+            google_api_key=os.getenv("GEMINI_API_KEY"),
+            temperature=0.1,
         )
 
-        # memory for context
-        self.memory = ConversationBufferWindowMemory(
-            k=memory_window,
-            return_messages=True,
-        )
+        # memory for context, the last few (input, output) pairs
+        self.memory: Deque[Tuple[str, str]] = deque(maxlen=memory_window)
 
         self.collector = MetricCollector()
         self.executor = CommandExecutor(self.console)
 
+    @staticmethod
+    def _compute_derived(snapshot: SystemSnapshot) -> Dict[str, Any]:
+        """Metrics derived from the snapshot, shared by the structured and hybrid formats"""
+        memory = snapshot.memory_db
+
+        return {
+            "load_per_core": [load / snapshot.cpu_cores for load in snapshot.load_avg],
+            "memory_usage_percent": memory["used"] / memory["total"] * 100,
+            "disk_usage_percent": snapshot.disk_usage_percent,
+        }
+
     def _prepare_data(self, snapshot: SystemSnapshot) -> str:
         """Prepare data based on format setting"""
 
@@ -267,38 +504,28 @@ class AIMonitor:
             free: {snapshot.raw_free}
             df: {snapshot.raw_df}
             """
-        elif self.data_format == DataFormat.STRUCTURED:
+
+        derived = self._compute_derived(snapshot)
+
+        if self.data_format == DataFormat.STRUCTURED:
             # Sending structure data with json
             data = {
                 "load_avg": snapshot.load_avg,
                 "cores": snapshot.cpu_cores,
-                "load_per_core": [
-                    load / snapshot.cpu_cores for load in snapshot.load_avg
-                ],
                 "memory": snapshot.memory_db,
-                "memory_usage_percent": (
-                    snapshot.memory_db["used"] / snapshot.memory_db["total"]
-                )
-                * 100,
-                "disk_usage_percent": snapshot.disk_usage_percent,
+                **derived,
             }
 
-            return f"System Metrics:\n{json.dumps(data, indent=2)}"
+            return (
+                self.STRUCTURED_HEADER
+                + orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+            )
 
         else:
-            structured = {
-                "load_per_core": [
-                    line / snapshot.cpu_cores for line in snapshot.load_avg
-                ],
-                "memory_usage_percent": (
-                    snapshot.memory_db["used"] / snapshot.memory_db["total"]
-                )
-                * 100,
-                "disk_usage_percent": snapshot.disk_usage_percent,
-            }
+            structured = orjson.dumps(derived, option=orjson.OPT_INDENT_2).decode()
 
             return f"""
-                Structured metrics: {json.dumps(structured, indent=2)}
+                Structured metrics: {structured}
 
                 Raw context:
                 {snapshot.raw_uptime}
@@ -308,16 +535,16 @@ class AIMonitor:
     def _format_response(self, response: str) -> str:
         """Formatting response based on verbosity"""
         if self.verbosity == Verbosity.CONCISE:
-            # extract only the summary and critical actions
-            lines = response.split("\n")
-            important = [
-                line
-                for line in lines
-                if any(k in line.upper() for k in ["SUMMARY:", "CRITICAL:", "ACTION:"])
-            ]
+            # extract only the summary and critical actions, stopping at 3 lines
+            important = []
+            for line in response.splitlines():
+                upper = line.upper()
+                if any(key in upper for key in CONCISE_KEYS):
+                    important.append(line)
+                    if len(important) == CONCISE_MAX_LINES:
+                        break
 
-            # maxing 3 lines
-            return "\n".join(important[3:])
+            return "\n".join(important)
 
         elif self.verbosity == Verbosity.DETAILED:
             # add in extra context
@@ -327,7 +554,7 @@ class AIMonitor:
         return response
 
     # analyzing section
-    def analyze(self) -> Dict[str, Any]:
+    async def analyze(self) -> Dict[str, Any]:
         """
         Workflow: collect data -> analyze -> suggest
         Return: dict with summary, issues, and suggested commands (fixes)
@@ -335,7 +562,7 @@ class AIMonitor:
 
         # collecting the data
         self.console.print("[blue]Collecting system metrics...[/blue]")
-        snapshot = self.collector.collect(
+        snapshot = await self.collector.collect_async(
             include_raw=(self.data_format != DataFormat.STRUCTURED)
         )
 
@@ -345,21 +572,35 @@ class AIMonitor:
         # ai analysis
         self.console.print("[green]Analyzing system state...[/green]")
 
+        from langchain_core.messages import SystemMessage, HumanMessage
+
+        # earlier analyses go in front of the new data so the LLM can follow up on them
+        if self.memory:
+            prior = "\n".join(f"user: {i}\nassistant: {o}" for i, o in self.memory)
+            data_str = f"Previous analyses:\n{prior}\n\n{data_str}"
+
         messages = [
             SystemMessage(content=self.SYSTEM_PROMPT),
             HumanMessage(content=data_str),
         ]
 
-        response = self.llm.invoke(messages)
-        formatted_response = self._format_response(response.content)
+        # stream tokens into a live panel so the analysis shows up as it is generated,
+        # the panel is transient since the formatted analysis gets printed afterwards
+        chunks = []
+        with Live(console=self.console, transient=True) as live:
+            async for chunk in self.llm.astream(messages):
+                chunks.append(chunk.content)
+                live.update(Panel("".join(chunks), border_style="green"))
+
+        response = "".join(chunks)
+        formatted_response = self._format_response(response)
 
         # parsing the response for commands
-        suggested_commands = self._extract_commands(response.content)
+        suggested_commands = self._extract_commands(response)
 
         # saving to memory so the LLM can continue investigating
-        self.memory.save_context(
-            {"input": f"System analysis at {snapshot.load_avg}"},
-            {"output": formatted_response},
+        self.memory.append(
+            (f"System analysis at {snapshot.load_avg}", formatted_response)
         )
 
         return {
@@ -371,47 +612,116 @@ class AIMonitor:
     def _extract_commands(self, response: str) -> List[str]:
         """Extracting suggested commands from AI responses"""
         commands = []
-        lines = response.split("\n")
-
-        for line in lines:
-            line = line.strip()
 
-            # looking for lines that looks like it has commands
-            if line.startswith("$") or line.startswith("sudo") or "systemctl" in line:
-                # clean up the command
-                cmd = line.strip("$").strip()
+        # one pass over the whole response for lines that look like they have commands
+        for match in self.COMMAND_LINE_RE.finditer(response):
+            # clean up the command
+            cmd = match.group(1).strip().strip("$").strip()
 
-                if cmd:
-                    commands.append(cmd)
+            if cmd:
+                commands.append(cmd)
 
         return commands
 
-    def run_fixes(self, commands: List[str]) -> List[Dict]:
-        """Execute suggested fixes with user confirmation"""
-        results = []
+    @staticmethod
+    def parse_selection(answer: str, count: int) -> Optional[set]:
+        """
+        Turns an answer like "1 3", "1,2", "all" or "none" into the picked numbers
+        Returns None when the answer has anything outside 1..count
+        """
+        answer = answer.strip().lower()
+        if answer == "all":
+            return set(range(1, count + 1))
+        if answer in ("", "none"):
+            return set()
+
+        picked = set()
+        for token in answer.replace(",", " ").split():
+            if not token.isdigit() or not 1 <= int(token) <= count:
+                return None
+            picked.add(int(token))
+
+        return picked
+
+    def _ask_selection(self, count: int) -> set:
+        """Asks once which fixes to run, again only if the answer can't be parsed"""
+        while True:
+            with interruptible_prompt():
+                answer = Prompt.ask(
+                    "Fixes to execute (numbers, 'all' or 'none')",
+                    default="none",
+                    console=self.console,
+                )
+            picked = self.parse_selection(answer, count)
+            if picked is not None:
+                return picked
 
-        for cmd in commands:
-            self.console.print(f"\n[yellow]Suggested fix:[/yellow] {cmd}")
+            self.console.print(f"[red]Pick numbers between 1 and {count}[/red]")
 
-            if Confirm.ask("Execute this command?"):
-                success, output = self.executor.execute(cmd)
+    async def run_fixes(self, commands: List[str]) -> List[Dict]:
+        """
+        Execute suggested fixes with user confirmation
 
-                results.append(
-                    {"command": cmd, "success": success, "output": output[:200]}
-                )
+        Diagnostic commands are read-only so they are listed and run concurrently
+        without a prompt, every other command (sudo included) is picked in a single
+        prompt and executed one at a time
+        """
+        results: List[Optional[Dict]] = [None] * len(commands)
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_DIAGNOSTICS)
 
-                if success:
-                    self.console.print("[green]Command executed[/green]")
-                else:
-                    self.console.print(f"[red]Failed: {output}[/red]")
+        async def run_diagnostic(i: int, cmd: str):
+            async with semaphore:
+                success, output = await self.executor.execute(cmd)
+
+            results[i] = {"command": cmd, "success": success, "output": output[:200]}
+
+        read_only, fixes = [], []
+        for i, cmd in enumerate(commands):
+            if self.executor.is_diagnostic_command(cmd):
+                read_only.append((i, cmd))
             else:
-                results.append(
-                    {"command": cmd, "success": False, "output": "Skipped by user"}
-                )
+                fixes.append((i, cmd))
+
+        # diagnostics run without a prompt, but never without being shown first
+        if read_only:
+            self.console.print("\n[cyan]Read-only diagnostics to run:[/cyan]")
+            for _, cmd in read_only:
+                self.console.print(f"  {cmd}")
+
+        picked = set()
+        if fixes:
+            self.console.print("\n[yellow]Suggested fixes:[/yellow]")
+            for n, (_, cmd) in enumerate(fixes, 1):
+                self.console.print(f"  [bold]{n}[/bold]. {cmd}")
+
+            # one prompt for every fix, asked on the main thread before anything
+            # starts so Ctrl-C at the prompt exits right away
+            picked = self._ask_selection(len(fixes))
+
+        diagnostics = asyncio.gather(*(run_diagnostic(i, cmd) for i, cmd in read_only))
+
+        # fixes may change system state so they still run one at a time
+        for n, (i, cmd) in enumerate(fixes, 1):
+            if n not in picked:
+                results[i] = {
+                    "command": cmd,
+                    "success": False,
+                    "output": "Skipped by user",
+                }
+                continue
+
+            success, output = await self.executor.execute(cmd, False)
+            results[i] = {
+                "command": cmd,
+                "success": success,
+                "output": output[:200],
+            }
+
+        await diagnostics
 
         return results
 
-    def monitor_loop(self):
+    async def monitor_loop(self):
         """Main monitoring loop"""
         self.console.print(
             Panel.fit(
@@ -422,7 +732,7 @@ class AIMonitor:
         )
 
         # analyze system
-        result = self.analyze()
+        result = await self.analyze()
 
         # display analysis
         self.console.print("\n[bold]Analysis:[/bold]")
@@ -434,30 +744,50 @@ class AIMonitor:
                 f"\n[yellow]Found {len(result['commands'])} suggested fixes[/yellow]"
             )
 
-            if Confirm.ask("Would you like to review and execute fixes?"):
-                fix_results = self.run_fixes(result["commands"])
+            with interruptible_prompt():
+                review = Confirm.ask("Would you like to review and execute fixes?")
+
+            if review:
+                fix_results = await self.run_fixes(result["commands"])
 
                 # print out the summary
-                self.console.print("\n[bold]Execution Summary:[/bold]")
+                summary = Table(title="Execution Summary", title_justify="left")
+                summary.add_column("", no_wrap=True)
+                summary.add_column("Command", style="cyan")
+                summary.add_column("Output", overflow="fold")
                 for r in fix_results:
                     status = "[green]:)[/green]" if r["success"] else "[red]:([/red]"
-                    self.console.print(f"{status} {r['command']}")
+                    summary.add_row(status, r["command"], r["output"].strip())
+
+                self.console.print(summary)
         else:
             self.console.print("\n[green]System is healthy, no fixes needed[/green]")
 
 
 # intergration point for main cli
 def run_ai_monitor(
-    data_format: str = "hybrid", verbosity: str = "normal", auto_fix: bool = False
+    data_format: str = "hybrid",
+    verbosity: str = "normal",
+    auto_fix: bool = False,
+    console: Optional[Console] = None,
 ):
-    """Entry point from main CLI"""
+    """Entry point from main CLI, reusing its console when one is passed in"""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    console = console or Console()
+
     try:
         monitor = AIMonitor(
             data_format=DataFormat[data_format.upper()],
             verbosity=Verbosity[verbosity.upper()],
+            console=console,
         )
-        monitor.monitor_loop()
+        asyncio.run(monitor.monitor_loop())
 
+    except ImportError:
+        # let the CLI report the missing AI packages
+        raise
     except Exception as err:
-        Console().print(f"[red]Error: {str(err)}[/red]")
-        Console().print("[yellow]Check the API key and try again[/yellow]")
+        console.print(f"[red]Error: {str(err)}[/red]")
+        console.print("[yellow]Check the API key and try again[/yellow]")
@@ -1,37 +1,62 @@
 import os
+import re
+import shutil
 import subprocess
+import threading
+import time
 import typer
 
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cache, wraps
 
-from rich import box
+# rich.print only pulls in rich.console once something is printed
 from rich import print
-from rich.columns import Columns
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
 
-from typing import Annotated
+from collections.abc import Mapping
+from typing import Annotated, TYPE_CHECKING
 
 from config import config
 from .merge import merge
 
-try:
-    config_data = config.load_config_file(Path("config/config.toml"))
-except Exception:
-    config_data = {}
-    print(f"Check that a config.toml file is populated here: '{Path.home()}'")
-    print("Common Problems: an API key is not set, or is invalid.")
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
 
 app = typer.Typer(
     help="Surge - A DevOps CLI Tool For System Monitoring and Production Reliability"
 )
 
-console_config = config_data.get("console", {})
 
-console = Console(
-    force_terminal=console_config.get("force_color", True),
-)
+@cache
+def get_config() -> Mapping:
+    """
+    Loads config.toml on first use only, so commands that never touch the config
+    don't pay for the TOML parse
+    """
+    try:
+        return config.load_config_file(config.PATH)
+    except Exception:
+        print(f"Check that a config.toml file is populated here: '{config.PATH}'")
+        print("Common Problems: an API key is not set, or is invalid.")
+        return {}
+
+
+@cache
+def get_flat_config() -> dict:
+    """get_config() as {"section:param": value}, what merge() looks options up in"""
+    return config.flatten(get_config())
+
+
+@cache
+def get_console() -> "Console":
+    """Shared console, built the first time something renders through it"""
+    from rich.console import Console
+
+    console_config = get_config().get("console", {})
+    return Console(force_terminal=console_config.get("force_color", True))
+
 
 # Merges app.command() decorator w/ transposed merge() decorator
 cmd = app.command
@@ -41,7 +66,7 @@ def app_command_with_merge(*args, **kwargs):
     decorator = cmd(*args, **kwargs)
 
     def wrapper(func):
-        return decorator(merge()(func))
+        return decorator(merge(loader=get_flat_config)(func))
 
     return wrapper
 
@@ -49,80 +74,395 @@ def app_command_with_merge(*args, **kwargs):
 app.command = app_command_with_merge
 
 
-def run_cmd(cmd: str) -> str:
+# shared by the monitor getters, one worker each
+_POOL = ThreadPoolExecutor(max_workers=6, thread_name_prefix="surge")
+
+
+@cache
+def which(name: str) -> str | None:
+    """PATH lookup for the tools run_argv starts, cached for the life of the process"""
+    return shutil.which(name)
+
+
+# procfs files and command output are read into a reused buffer, one per thread
+# since the monitor getters run in parallel
+_local = threading.local()
+
+
+def _buffer() -> bytearray:
+    """This thread's 32K read buffer"""
+    buf = getattr(_local, "buf", None)
+    if buf is None:
+        buf = _local.buf = bytearray(32 * 1024)
+    return buf
+
+
+def run_argv(argv: list[str]) -> str:
     """
     Helper function to abstract lengthy subprocess command implementation :D
+    Takes the argv list as is, no shell and no re-splitting, so user input like
+    --host always stays a single argument.
+    """
+    if not argv:
+        return ""
+
+    # resolved once per tool, a missing one (no traceroute, ss...) is never spawned
+    exe = which(argv[0])
+    if exe is None:
+        return ""
+
+    try:
+        proc = subprocess.Popen(
+            [exe, *argv[1:]],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+        )
+    except OSError:
+        # callers treat empty output as unavailable
+        return ""
+
+    # the pipe is read straight into the buffer and only the filled part decoded
+    buf = _buffer()
+    view = memoryview(buf)
+    with proc:
+        size = 0
+        while size < len(buf):
+            n = proc.stdout.readinto(view[size:])
+            if not n:
+                break
+            size += n
+        else:
+            # more output than the buffer holds (long traceroutes, ss on busy hosts)
+            out = bytes(view) + proc.stdout.read()
+            return out.decode(errors="replace").strip()
+
+    return str(view[:size], "utf-8", "replace").strip()
+
+
+def read_proc(path: str) -> bytes:
+    """
+    Reads a procfs file directly, the data free/uptime/top would parse for us anyway.
+    Kept as bytes since int() and float() parse ASCII bytes without a decode step.
+    procfs files are generated on read, so each one is read with a single syscall
+    to avoid torn data between chunks (psutil uses 32K as well).
+    """
+    buf = _buffer()
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        n = os.readv(fd, [buf])
+        data = bytes(memoryview(buf)[:n])
+        # only files larger than the buffer (/proc/stat on big machines) need more reads
+        while n == len(buf):
+            n = os.readv(fd, [buf])
+            data += memoryview(buf)[:n]
+    finally:
+        os.close(fd)
+
+    return data
+
+
+def ttl_cache(seconds: float):
     """
+    Caches a getter's result per arguments for `seconds`, so repeated reads inside
+    one monitor tick hit procfs once. The ttl can be changed later through `.ttl`
+    """
+
+    def decorator(func):
+        cache = {}
+
+        @wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            hit = cache.get(args)
+            if hit is not None and hit[0] > now:
+                return hit[1]
+
+            value = func(*args)
+            cache[args] = (now + wrapper.ttl, value)
+            return value
 
-    return subprocess.run(
-        cmd, shell=True, capture_output=True, text=True
-    ).stdout.strip()
+        wrapper.ttl = seconds
+        wrapper.cache_clear = cache.clear
+        return wrapper
 
+    return decorator
 
-def get_load() -> tuple[float] | int:
+
+def format_bytes(size: float) -> str:
     """
-    Utilizes Linux uptime for system load metrics and to determine core utilization
+    Human readable sizes in the style of df -h
     """
+    for unit in ("B", "K", "M", "G", "T"):
+        if size < 1024:
+            break
+        size /= 1024
+
+    return f"{size:.1f}{unit}"
 
-    uptime = run_cmd("uptime | awk -F'average:' '{print $2}'")
-    averages = [float(x.replace(",", "")) for x in uptime.split()]
-    cores = float(run_cmd("nproc"))
+
+# procfs parsers, one C-level scan per file instead of splitting every line.
+# /proc/loadavg and the /proc/stat cpu line stay a plain split, they're short
+# enough that a regex is slower
+_MEMINFO_RE = re.compile(
+    rb"^MemTotal: +(\d+).*?^MemFree: +(\d+).*?^MemAvailable: +(\d+)", re.S | re.M
+)
+_PING_SENT_RE = re.compile(r"(\d+) packets transmitted.*?([\d.]+%) packet loss")
+_PING_RTT_RE = re.compile(r"min/avg/max\S* = [\d.]+/([\d.]+)/")
+
+
+@cache
+def _cores() -> int:
+    """
+    CPUs this process may run on, fixed for the life of the process.
+    The affinity mask respects cpusets/taskset pinning, cpu_count is the fallback
+    where sched_getaffinity doesn't exist (macOS)
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# the kernel only recomputes load averages every 5 seconds
+@ttl_cache(5)
+def get_load() -> tuple[list[float], int]:
+    """
+    Reads load averages from /proc/loadavg and the core count to determine utilization
+    """
+
+    # "0.10 0.20 0.30 1/123 4567", only the first three fields are split off
+    averages = [float(x) for x in read_proc("/proc/loadavg").split(b" ", 3)[:3]]
+    cores = _cores()
 
     return averages, cores
 
 
-def get_cpu() -> tuple[float]:
+def get_cpu_times() -> list[int]:
     """
-    Uses top to find CPU utilization grouped by user, system, and idle percents.
+    Aggregate CPU jiffies (user, nice, system, idle, iowait, irq, softirq, steal)
     """
-    top = run_cmd('top -bn1 | grep "Cpu(s)"').split(",")
-    user = top[0].split()[-2]
-    system = top[1].split()[0]
-    idle = top[3].split()[0]
+    stat = read_proc("/proc/stat")
+
+    # "cpu  user nice system idle ...", only the first line is split
+    return [int(x) for x in stat[: stat.index(b"\n")].split()[1:9]]
+
+
+@ttl_cache(1)
+def get_cpu(sample: float = 0.1) -> tuple[float, float, float]:
+    """
+    Samples /proc/stat twice for CPU utilization grouped by user, system, and idle.
+    """
+    before = get_cpu_times()
+    time.sleep(sample)
+    after = get_cpu_times()
+
+    delta = [new - old for old, new in zip(before, after)]
+    total = sum(delta) or 1
+    user, system, idle = (delta[i] / total * 100 for i in (0, 2, 3))
 
     return user, system, idle
 
 
-def get_memory() -> tuple[float]:
+@ttl_cache(1)
+def get_memory() -> tuple[int, int, int]:
     """
-    Returns remaining memory by group using free.
+    Returns total, used, and free memory in MB from /proc/meminfo.
     """
-    free = run_cmd("free -m | grep Mem").split()
-    total, used, free_mem = free[1], free[2], free[3]
+    total, free_kb, available = _MEMINFO_RE.search(read_proc("/proc/meminfo")).groups()
+
+    total = int(total) // 1024
+    used = total - int(available) // 1024
+    free_mem = int(free_kb) // 1024
 
     return total, used, free_mem
 
 
-def get_disk() -> tuple[float]:
+@ttl_cache(1)
+def get_disk() -> tuple[int, int, int, float]:
     """
-    Returns disk usage with df.
+    Returns disk usage of the root filesystem in bytes, plus the used percent.
     """
-    df = run_cmd("df -h / | tail -1").split()
-    size, used, available, percent = df[1], df[2], df[3], df[4]
+    st = os.statvfs("/")
+    size = st.f_blocks * st.f_frsize
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    # f_bavail leaves out blocks reserved for root, same as df's Avail column
+    available = st.f_bavail * st.f_frsize
+    percent = used / (used + available) * 100
 
     return size, used, available, percent
 
 
 def get_top_processes(n: int = 5):
-    def fetch_top(sort_by: str):
-        result = run_cmd(f"ps aux --sort=-{sort_by} | head -n {n + 1}").splitlines()
-        headers = result[0].split()
-        ps = []
-        for line in result[1:]:
-            parts = line.split(None, len(headers) - 1)
-            ps.append(dict(zip(headers, parts)))
-        return ps
-
-    top_cpu = fetch_top("%cpu")
-    top_mem = fetch_top("%mem")
+    """
+    Top n processes by CPU and by memory, as dicts keyed like ps aux's header.
+    Uses psutil when it's installed, otherwise a single ps aux run.
+    """
+    try:
+        procs = _ps_psutil()
+    except ImportError:
+        procs = _ps_aux()
+
+    top_cpu = sorted(procs, key=lambda p: -float(p["%CPU"]))[:n]
+    top_mem = sorted(procs, key=lambda p: -float(p["%MEM"]))[:n]
     return top_cpu, top_mem
 
 
+def _ps_aux() -> list[dict]:
+    """Every process from ps aux, one dict per line"""
+    lines = run_argv(["ps", "aux"]).splitlines()
+    if not lines:
+        return []
+
+    headers = lines[0].split()
+    return [
+        dict(zip(headers, line.split(None, len(headers) - 1))) for line in lines[1:]
+    ]
+
+
+def _ps_psutil() -> list[dict]:
+    """
+    Same rows as _ps_aux straight from psutil, without starting ps.
+    %CPU is cpu time over lifetime like ps computes it, not a sampled percent.
+    """
+    import psutil
+
+    now = time.time()
+    procs = []
+    for proc in psutil.process_iter(
+        ["pid", "name", "cmdline", "cpu_times", "create_time", "memory_percent"]
+    ):
+        info = proc.info
+        if info["cpu_times"] is None or info["create_time"] is None:
+            # gone or not readable while iterating
+            continue
+
+        cpu_time = info["cpu_times"].user + info["cpu_times"].system
+        elapsed = max(now - info["create_time"], 1e-3)
+        procs.append(
+            {
+                "PID": str(info["pid"]),
+                "%CPU": f"{cpu_time / elapsed * 100:.1f}",
+                "%MEM": f"{info['memory_percent'] or 0.0:.1f}",
+                "COMMAND": " ".join(info["cmdline"] or []) or f"[{info['name']}]",
+            }
+        )
+
+    return procs
+
+
+@cache
+def _whole_disks() -> frozenset[str]:
+    """Block devices that are whole disks, partitions have no /sys/block entry"""
+    try:
+        return frozenset(
+            name for name in os.listdir("/sys/block") if not name.startswith("loop")
+        )
+    except OSError:
+        return frozenset()
+
+
+# (time, {device: counters}) from the previous get_io call
+_last_diskstats: tuple[float, dict[str, tuple[int, ...]]] | None = None
+
+
+@ttl_cache(1)
+def get_io() -> dict[str, tuple[float, float, float, float]]:
+    """
+    Per disk reads/s, writes/s, read KB/s and write KB/s from /proc/diskstats.
+    Rates are deltas against the previous call; the first call averages since boot.
+    """
+    global _last_diskstats
+
+    now = time.monotonic()
+    disks = _whole_disks()
+    stats = {}
+    for line in read_proc("/proc/diskstats").splitlines():
+        # major minor name reads merged sectors ms writes merged sectors ms ...
+        fields = line.split()
+        name = fields[2].decode()
+        if name in disks:
+            stats[name] = (
+                int(fields[3]),
+                int(fields[5]),
+                int(fields[7]),
+                int(fields[9]),
+            )
+
+    if _last_diskstats is None:
+        elapsed = float(read_proc("/proc/uptime").split(b" ", 1)[0])
+        previous = {}
+    else:
+        then, previous = _last_diskstats
+        elapsed = now - then
+    _last_diskstats = (now, stats)
+
+    elapsed = elapsed or 1.0
+    rates = {}
+    for name, counters in stats.items():
+        reads, read_sectors, writes, write_sectors = (
+            new - old for new, old in zip(counters, previous.get(name, (0, 0, 0, 0)))
+        )
+        # diskstats sectors are always 512 bytes
+        rates[name] = (
+            reads / elapsed,
+            writes / elapsed,
+            read_sectors / 2 / elapsed,
+            write_sectors / 2 / elapsed,
+        )
+
+    return rates
+
+
+@dataclass
+class MetricsSnapshot:
+    """One monitor tick worth of metrics, None for anything that wasn't requested"""
+
+    load: tuple[list[float], int] | None = None
+    cpu: tuple[float, float, float] | None = None
+    memory: tuple[int, int, int] | None = None
+    disk: tuple[int, int, int, float] | None = None
+    io: dict[str, tuple[float, float, float, float]] | None = None
+    processes: tuple[list[dict], list[dict]] | None = None
+
+
+def take_snapshot(
+    load: bool = True,
+    cpu: bool = True,
+    ram: bool = True,
+    disk: bool = True,
+    io: bool = False,
+    process: int = 0,
+) -> MetricsSnapshot:
+    """
+    Collects every requested metric in one pass. The getters are independent,
+    get_cpu mostly sleeps between samples and ps is a subprocess, so the other
+    reads all happen while it waits.
+    """
+    futures = {
+        field: _POOL.submit(getter, *args)
+        for field, enabled, getter, args in (
+            ("load", load, get_load, ()),
+            ("cpu", cpu, get_cpu, ()),
+            ("memory", ram, get_memory, ()),
+            ("disk", disk, get_disk, ()),
+            ("io", io, get_io, ()),
+            ("processes", process, get_top_processes, (process,)),
+        )
+        if enabled
+    }
+
+    return MetricsSnapshot(**{field: f.result() for field, f in futures.items()})
+
+
 def create_table(
     title: str,
     title_style: str = "bold cyan",
     header_style: str = "bold cyan",
-) -> Table:
+) -> "Table":
+    from rich import box
+    from rich.table import Table
+
     return Table(
         title=title,
         title_style=title_style,
@@ -136,57 +476,60 @@ def create_table(
     )
 
 
-@app.command()
-def monitor(
-    load: Annotated[
-        bool, typer.Option("-l", "--load", help="Show system load averages")
-    ] = True,
-    cpu: Annotated[bool, typer.Option("-c", "--cpu", help="Show CPU usage")] = True,
-    ram: Annotated[bool, typer.Option("-r", "--ram", help="Show RAM usage")] = True,
-    disk: Annotated[bool, typer.Option("-d", "--disk", help="Show Disk usage")] = True,
-    io: Annotated[
-        bool, typer.Option("-o", "--io", help="Show Disk I/O statistics")
-    ] = True,
-    process: Annotated[
-        int,
-        typer.Option(
-            "-p", "--ps", "--process", help="Show the top n processes by CPU and RAM"
-        ),
-    ] = 5,
-    verbose: Annotated[
-        bool, typer.Option("-v", "--verbose", help="Show detailed system metrics")
-    ] = False,
-):
+# Fixed column layouts of the monitor tables
+LOAD_COLUMNS = ("Interval", "Load")
+LOAD_VERBOSE_COLUMNS = LOAD_COLUMNS + ("Per CPU Util", "Status")
+CPU_COLUMNS = ("User (%)", "System (%)", "Idle (%)", "Status")
+MEMORY_COLUMNS = ("Total (MB)", "Used (MB)", "Free (MB)", "Status")
+DISK_COLUMNS = ("Size", "Used", "Available", "Usage %")
+IO_COLUMNS = ("Device", "Reads/s", "Writes/s", "Read KB/s", "Write KB/s")
+PROCESS_COLUMNS = ("PID", "CPU (%)", "MEM (%)", "Command")
+
+LOAD_INTERVALS = ("1 Minute", "5 Minutes", "15 Minutes")
+
+# Status markup, indexed by the number of thresholds a metric has crossed
+LOAD_STATUS = (
+    "[green]OK[/green]",
+    "[yellow]High System Load[/yellow]",
+    "[bold red]System Likely Overloaded[/bold red]",
+)
+CPU_STATUS = (
+    "[green]OK[/green]",
+    "[yellow]High CPU Usage[/yellow]",
+    "[red]Critical CPU Usage[/red]",
+)
+MEMORY_STATUS = ("[green]OK[/green]", "[yellow]High Memory Usage[/yellow]")
+
+
+def build_table(columns: tuple[str, ...]) -> "Table":
     """
-    Summary of all system metrics, including utilization of CPU, Memory, Network, and I/O.
+    Creates a monitor table with the given centered columns, ready for add_row
     """
+    table = create_table("")
+    for column in columns:
+        table.add_column(column, justify="center")
 
-    panels = []
+    return table
 
-    if load:
-        averages, cores = get_load()
 
-        table = create_table("")
+def render_dashboard(snap: MetricsSnapshot, verbose: bool = False) -> "Panel":
+    """
+    Builds the monitor dashboard from a snapshot, one panel per collected metric
+    """
+    # rendering only needs these here, keeps them off the import path of other commands
+    from rich.columns import Columns
+    from rich.panel import Panel
 
-        table.add_column("Interval", justify="center")
-        table.add_column("Load", justify="center")
-        if verbose:
-            table.add_column("Per CPU Util", justify="center")
-            table.add_column("Status", justify="center")
+    panels = []
 
-        intervals = ["1 Minute", "5 Minutes", "15 Minutes"]
+    if snap.load is not None:
+        averages, cores = snap.load
+        table = build_table(LOAD_VERBOSE_COLUMNS if verbose else LOAD_COLUMNS)
 
-        for i, interval in enumerate(intervals):
-            load_val = averages[i]
+        for interval, load_val in zip(LOAD_INTERVALS, averages):
             if verbose:
                 per_cpu = load_val / cores
-
-                if per_cpu < 0.7:
-                    status = "[green]OK[/green]"
-                elif per_cpu < 1.0:
-                    status = "[yellow]High System Load[/yellow]"
-                else:
-                    status = "[bold red]System Likely Overloaded[/bold red]"
+                status = LOAD_STATUS[(per_cpu >= 0.7) + (per_cpu >= 1.0)]
 
                 table.add_row(interval, f"{load_val:.2f}", f"{per_cpu:.3f}", status)
             else:
@@ -200,70 +543,61 @@ def monitor(
             )
         )
 
-    if cpu:
-        user, system, idle = get_cpu()
-        table = create_table("")
-        table.add_column("User (%)", justify="center")
-        table.add_column("System (%)", justify="center")
-        table.add_column("Idle (%)", justify="center")
-        table.add_column("Status", justify="center")
-
-        used = float(user) + float(system)
-        total = used + float(idle)
-        usage = (used / total) * 100
-
-        if usage >= 85:
-            status = "[red]Critical CPU Usage[/red]"
-        elif usage >= 70:
-            status = "[yellow]High CPU Usage[/yellow]"
-        else:
-            status = "[green]OK[/green]"
+    if snap.cpu is not None:
+        user, system, idle = snap.cpu
+        table = build_table(CPU_COLUMNS)
+
+        usage = user + system
+        status = CPU_STATUS[(usage >= 70) + (usage >= 85)]
 
-        table.add_row(user, system, idle, status)
+        table.add_row(f"{user:.1f}", f"{system:.1f}", f"{idle:.1f}", status)
         panels.append(
             Panel(table, title="[bold cyan]CPU Usage[/bold cyan]", border_style="cyan")
         )
 
-    if ram:
-        total, used, free = get_memory()
-        table = create_table("")
-        table.add_column("Total (MB)", justify="center")
-        table.add_column("Used (MB)", justify="center")
-        table.add_column("Free (MB)", justify="center")
-        table.add_column("Status", justify="center")
+    if snap.memory is not None:
+        total, used, free = snap.memory
+        table = build_table(MEMORY_COLUMNS)
 
-        if (float(used) / float(total)) * 100 >= 85:
-            status = "[yellow]High Memory Usage[/yellow]"
-        else:
-            status = "[green]OK[/green]"
+        status = MEMORY_STATUS[(used / total) * 100 >= 85]
 
-        table.add_row(total, used, free, status)
+        table.add_row(str(total), str(used), str(free), status)
         panels.append(
             Panel(
                 table, title="[bold cyan]Memory Usage[/bold cyan]", border_style="cyan"
             )
         )
 
-    if disk:
-        size, used, available, percent = get_disk()
-        table = create_table("")
-        table.add_column("Size", justify="center")
-        table.add_column("Used", justify="center")
-        table.add_column("Available", justify="center")
-        table.add_column("Usage %", justify="center")
-        table.add_row(size, used, available, percent)
+    if snap.disk is not None:
+        size, used, available, percent = snap.disk
+        table = build_table(DISK_COLUMNS)
+        table.add_row(
+            format_bytes(size),
+            format_bytes(used),
+            format_bytes(available),
+            f"{percent:.0f}%",
+        )
         panels.append(
             Panel(table, title="[bold cyan]Disk Usage[/bold cyan]", border_style="cyan")
         )
 
-    if process:
-        list_cpu, _ = get_top_processes(process)
+    if snap.io is not None:
+        table = build_table(IO_COLUMNS)
+        for device, (reads, writes, read_kb, write_kb) in sorted(snap.io.items()):
+            table.add_row(
+                device,
+                f"{reads:.1f}",
+                f"{writes:.1f}",
+                f"{read_kb:.1f}",
+                f"{write_kb:.1f}",
+            )
+        panels.append(
+            Panel(table, title="[bold cyan]Disk I/O[/bold cyan]", border_style="cyan")
+        )
 
-        table = create_table("")
-        table.add_column("PID", justify="center")
-        table.add_column("CPU (%)", justify="center")
-        table.add_column("MEM (%)", justify="center")
-        table.add_column("Command", justify="center")
+    if snap.processes is not None:
+        list_cpu, _ = snap.processes
+        table = build_table(PROCESS_COLUMNS)
 
         for proc in list_cpu:
             cmd = proc["COMMAND"]
@@ -273,21 +607,222 @@ def monitor(
         panels.append(
             Panel(
                 table,
-                title=f"[bold yellow]Top {process} Processes by CPU[/bold yellow]",
+                title=f"[bold yellow]Top {len(list_cpu)} Processes by CPU[/bold yellow]",
                 border_style="yellow",
             )
         )
 
     columns = Columns(panels)
-    dashboard = Panel(columns, title="Monitoring Dashboard", border_style="bold green")
-    console.print(dashboard)
+    return Panel(columns, title="Monitoring Dashboard", border_style="bold green")
+
+
+@app.command()
+def monitor(
+    load: Annotated[
+        bool, typer.Option("-l", "--load", help="Show system load averages")
+    ] = True,
+    cpu: Annotated[bool, typer.Option("-c", "--cpu", help="Show CPU usage")] = True,
+    ram: Annotated[bool, typer.Option("-r", "--ram", help="Show RAM usage")] = True,
+    disk: Annotated[bool, typer.Option("-d", "--disk", help="Show Disk usage")] = True,
+    io: Annotated[
+        bool, typer.Option("-o", "--io", help="Show Disk I/O statistics")
+    ] = True,
+    process: Annotated[
+        int,
+        typer.Option(
+            "-p", "--ps", "--process", help="Show the top n processes by CPU and RAM"
+        ),
+    ] = 5,
+    verbose: Annotated[
+        bool, typer.Option("-v", "--verbose", help="Show detailed system metrics")
+    ] = False,
+    interval: Annotated[
+        float,
+        typer.Option(
+            "-i", "--interval", min=0, help="Refresh every n seconds, 0 to run once"
+        ),
+    ] = 0,
+):
+    """
+    Summary of all system metrics, including utilization of CPU, Memory, Network, and I/O.
+    With --interval the dashboard refreshes in place until interrupted.
+    """
+    wanted = {
+        "load": load,
+        "cpu": cpu,
+        "ram": ram,
+        "disk": disk,
+        "io": io,
+        "process": process,
+    }
+
+    if not interval:
+        get_console().print(render_dashboard(take_snapshot(**wanted), verbose))
+        return
+
+    # getters cached longer than a tick would show the same values twice
+    for getter in (get_cpu, get_memory, get_disk, get_io):
+        getter.ttl = min(getter.ttl, interval / 2)
+
+    # only polling needs an event loop, asyncio stays off every other command's startup
+    import asyncio
+
+    try:
+        asyncio.run(poll_dashboard(interval, wanted, verbose))
+    except KeyboardInterrupt:
+        pass
+
+
+async def poll_dashboard(interval: float, wanted: dict, verbose: bool) -> None:
+    """
+    Redraws the dashboard every `interval` seconds. The next snapshot is collected
+    in a worker thread while the loop sleeps, started early by as long as the last
+    collection took, so it's ready right when the tick is due.
+    """
+    import asyncio
+
+    from rich.live import Live
+
+    start = time.monotonic()
+    snap = await asyncio.to_thread(take_snapshot, **wanted)
+    took = time.monotonic() - start
+
+    with Live(console=get_console(), auto_refresh=False) as live:
+        deadline = time.monotonic()
+        while True:
+            live.update(render_dashboard(snap, verbose), refresh=True)
+            deadline += interval
+
+            await asyncio.sleep(max(0.0, deadline - took - time.monotonic()))
+            start = time.monotonic()
+            snap = await asyncio.to_thread(take_snapshot, **wanted)
+            took = time.monotonic() - start
+
+            await asyncio.sleep(max(0.0, deadline - time.monotonic()))
+
+
+# network section headers, built once instead of on every print
+_HEADERS = {
+    title: f"\n[bold]{title}[/bold]\n{'-' * len(title)}"
+    for title in ("Ping", "Traceroute", "HTTP", "DNS", "Sockets (ss)")
+}
+
+
+def http_probe(url: str, timeout: float = 5) -> tuple[str, str]:
+    """
+    One GET over a single connection, timed like curl's -w summary.
+    Returns the summary line and the status line plus response headers,
+    or an empty summary and the error message if the request fails.
+    """
+    import http.client
+    from urllib.parse import urlsplit
+
+    parts = urlsplit(url)
+    https = parts.scheme == "https"
+    conn_cls = http.client.HTTPSConnection if https else http.client.HTTPConnection
+    path = parts.path or "/"
+    if parts.query:
+        path += f"?{parts.query}"
+
+    # hostname/port rather than netloc, so user:pw@ never ends up in the host
+    try:
+        if not parts.hostname:
+            return "", f"No host in URL: {url}"
+        port = parts.port or (443 if https else 80)
+    except ValueError as err:
+        return "", str(err)
+
+    conn = conn_cls(parts.hostname, port, timeout=timeout)
+    try:
+        start = time.perf_counter()
+        conn.connect()
+        connect = time.perf_counter() - start
+
+        conn.request("GET", path, headers={"User-Agent": "surge"})
+        resp = conn.getresponse()
+        ttfb = time.perf_counter() - start
+        resp.read()
+        total = time.perf_counter() - start
+    # ValueError covers UnicodeError from IDNA encoding a bad host such as a..b
+    except (OSError, ValueError, http.client.HTTPException) as err:
+        return "", str(err)
+    finally:
+        conn.close()
+
+    brief = f"HTTP {resp.status} | total {total:.3f}s | connect {connect:.3f}s | ttfb {ttfb:.3f}s"
+    version = "1.1" if resp.version == 11 else "1.0"
+    headers = "\n".join(
+        [f"HTTP/{version} {resp.status} {resp.reason}"]
+        + [f"{name}: {value}" for name, value in resp.getheaders()]
+    )
+
+    return brief, headers
+
+
+def icmp_ping(host: str, count: int) -> str | None:
+    """
+    Pings in-process over one unprivileged ICMP socket when icmplib is installed.
+    None means icmplib is missing or not allowed here, so the ping binary is used.
+    """
+    try:
+        from icmplib import ping
+        from icmplib.exceptions import ICMPLibError
+    except ImportError:
+        return None
+
+    try:
+        result = ping(host, count=count, interval=0.2, timeout=2, privileged=False)
+    except (ICMPLibError, OSError):
+        return None
+
+    return f"sent={result.packets_sent} | loss={result.packet_loss:.0%} | avg_rtt_ms={result.avg_rtt:.3f}"
+
+
+def icmp_trace(host: str) -> str | None:
+    """
+    Traceroute through icmplib, which needs raw sockets (root).
+    None falls back to the traceroute/mtr binaries.
+    """
+    try:
+        from icmplib import traceroute
+        from icmplib.exceptions import ICMPLibError
+    except ImportError:
+        return None
+
+    try:
+        hops = traceroute(host, count=1, timeout=1)
+    except (ICMPLibError, OSError):
+        return None
+
+    return "\n".join(
+        f"{hop.distance:>2}  {hop.address}  {hop.avg_rtt:.3f} ms" for hop in hops
+    )
+
+
+def dns_lookup(domain: str, dtype: str) -> str | None:
+    """
+    Resolves with dnspython when it's installed, one resolver and no dig process.
+    None falls back to dig/nslookup.
+    """
+    try:
+        import dns.exception
+        import dns.resolver
+    except ImportError:
+        return None
+
+    try:
+        answers = dns.resolver.resolve(domain, dtype, lifetime=5)
+    except dns.exception.DNSException:
+        return None
+
+    return "\n".join(answer.to_text() for answer in answers)
 
 
 @app.command("network")
 def network(
     url: Annotated[
         str | None,
-        typer.Option("-u", "--url", help="HTTP URL to test (curl)", show_default=False),
+        typer.Option("-u", "--url", help="HTTP URL to test", show_default=False),
     ] = None,
     host: Annotated[
         str | None,
@@ -321,8 +856,7 @@ def network(
     """
 
     def header(title: str):
-        print(f"\n[bold]{title}[/bold]")
-        print("-" * len(title))
+        print(_HEADERS[title])
 
     def warn(msg: str):
         print(f"[warn] {msg}")
@@ -330,34 +864,16 @@ def network(
     def normalize_url(u: str) -> str:
         return u if u.startswith(("http://", "https://")) else f"http://{u}"
 
-    def curl_brief(u: str) -> str:
-        fmt = "HTTP %{http_code} | total %{time_total}s | connect %{time_connect}s | ttfb %{time_starttransfer}s\n"
-        return run_cmd(f'curl -s -o /dev/null -w "{fmt}" {u}')
-
     def summarize_ping(out: str) -> str:
-        lines = out.splitlines()
-        sent = loss = avg = None
-        for ln in lines:
-            if "packets transmitted" in ln and "packet loss" in ln:
-                parts = ln.replace(",", "").split()
-                try:
-                    sent = int(parts[0])
-                    loss = parts[6]
-                except Exception:
-                    pass
-            if "rtt min/avg/max" in ln or "round-trip min/avg/max" in ln:
-                try:
-                    avg = ln.split("=")[1].split("/")[1].strip()
-                except Exception:
-                    pass
         bits = []
 
-        if sent is not None:
-            bits.append(f"sent={sent}")
-        if loss is not None:
-            bits.append(f"loss={loss}")
-        if avg is not None:
-            bits.append(f"avg_rtt_ms={avg}")
+        sent = _PING_SENT_RE.search(out)
+        if sent:
+            bits.append(f"sent={sent[1]}")
+            bits.append(f"loss={sent[2]}")
+        rtt = _PING_RTT_RE.search(out)
+        if rtt:
+            bits.append(f"avg_rtt_ms={rtt[1]}")
 
         return " | ".join(bits) if bits else (out.strip()[:200] if out else "")
 
@@ -388,39 +904,46 @@ def network(
     # ---- ping / traceroute (or mtr -r fallback) ----
     if host:
         header("Ping")
-        ping_out = run_cmd(f"ping -c {requests} {host}")
-        print(
-            summarize_ping(ping_out)
-            if ping_out
-            else "[warn] ping not available or produced no output"
-        )
+        ping_summary = icmp_ping(host, requests)
+        if ping_summary is None:
+            ping_out = run_argv(["ping", "-c", str(requests), host])
+            ping_summary = (
+                summarize_ping(ping_out)
+                if ping_out
+                else "[warn] ping not available or produced no output"
+            )
+        print(ping_summary)
 
         if not no_trace:
             header("Traceroute")
-            trace_out = run_cmd(f"traceroute {host}") or run_cmd(f"mtr -r {host}")
+            trace_out = (
+                icmp_trace(host)
+                or run_argv(["traceroute", host])
+                or run_argv(["mtr", "-r", host])
+            )
             print(
                 summarize_trace(trace_out)
                 if trace_out
                 else "[warn] traceroute/mtr not available or produced no output"
             )
 
-    # ---- http (curl) ----
+    # ---- http ----
     if url:
-        header("HTTP (curl)")
-        u = normalize_url(url)
-        print(curl_brief(u))
-        headers = run_cmd(f"curl -s -I {u}")
-        print(
-            headers.strip()
-            if headers
-            else "[warn] curl not available or produced no output"
-        )
+        header("HTTP")
+        brief, headers = http_probe(normalize_url(url))
+        if brief:
+            print(brief)
+            print(headers)
+        else:
+            warn(f"HTTP request failed: {headers}")
 
     # ---- dns ----
     if domain:
         header("DNS")
-        dns_out = run_cmd(f"dig +short {domain} {dtype}") or run_cmd(
-            f"nslookup -type={dtype} {domain}"
+        dns_out = (
+            dns_lookup(domain, dtype)
+            or run_argv(["dig", "+short", domain, dtype])
+            or run_argv(["nslookup", f"-type={dtype}", domain])
         )
         print(
             dns_out.strip()
@@ -431,7 +954,7 @@ def network(
     # ---- sockets (ss) ----
     if sockets:
         header("Sockets (ss)")
-        ss_out = run_cmd("ss -tulwn")
+        ss_out = run_argv(["ss", "-tulwn"])
         print(ss_out or "[warn] ss not available or produced no output")
 
 
@@ -459,9 +982,14 @@ def ai(
         return
 
     try:
-        from ai.ai_monitor import run_ai_monitor
+        from .ai.ai_monitor import run_ai_monitor
 
-        run_ai_monitor(data_format=format, verbosity=verbosity, auto_fix=auto_fix)
+        run_ai_monitor(
+            data_format=format,
+            verbosity=verbosity,
+            auto_fix=auto_fix,
+            console=get_console(),
+        )
     except ImportError:
         print("[red]AI packages not installed[/red]")
         print("Run: pip install langchain langchain-google-genai rich")
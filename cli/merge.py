@@ -1,8 +1,133 @@
 import inspect
-from functools import wraps
+from collections.abc import Callable, Mapping
 
+from config.config import flatten
 
-def merge(section: str | None = None):
+
+def _fast_sig(func):
+    """
+    Parameter names, declared defaults and the Typer facing signature (every default
+    None) read straight off __code__/__defaults__, without inspect.signature building
+    and then copying a Parameter per argument.
+    Returns None for *args, **kwargs or positional-only params, _inspect_sig handles those
+    """
+    code = func.__code__
+    if code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS):
+        return None
+    if code.co_posonlyargcount:
+        return None
+
+    argcount = code.co_argcount
+    names = code.co_varnames[: argcount + code.co_kwonlyargcount]
+
+    defaults = func.__defaults__ or ()
+    declared_defaults = dict(zip(names[argcount - len(defaults) : argcount], defaults))
+    declared_defaults.update(func.__kwdefaults__ or {})
+
+    annotations = func.__annotations__
+    empty = inspect.Parameter.empty
+    new_sig = inspect.Signature(
+        [
+            inspect.Parameter(
+                name,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD
+                if i < argcount
+                else inspect.Parameter.KEYWORD_ONLY,
+                default=None,
+                annotation=annotations.get(name, empty),
+            )
+            for i, name in enumerate(names)
+        ],
+        return_annotation=annotations.get("return", empty),
+    )
+
+    return names, declared_defaults, new_sig
+
+
+def _inspect_sig(func):
+    """Same as _fast_sig through inspect.signature, for any parameter kind"""
+    orig_sig = inspect.signature(func)
+    declared_defaults = {
+        name: param.default
+        for name, param in orig_sig.parameters.items()
+        if param.default is not inspect._empty
+    }
+
+    # Modded signature with defaults set to None for Typer to see as optional; leaves *args, **kwargs, and positional-only params default
+    new_params = []
+    for param in orig_sig.parameters.values():
+        if param.kind in (
+            inspect.Parameter.VAR_POSITIONAL,
+            inspect.Parameter.VAR_KEYWORD,
+            inspect.Parameter.POSITIONAL_ONLY,
+        ):
+            new_params.append(param)
+        else:
+            new_params.append(param.replace(default=None))
+    new_sig = orig_sig.replace(parameters=new_params)
+
+    return tuple(orig_sig.parameters), declared_defaults, new_sig
+
+
+def _merge_args(params, kwargs, flat_config) -> dict:
+    """
+    Final keyword arguments for a command: the explicit value when it isn't None,
+    then the "section:param" config entry, then the declared default
+    """
+    final_args = {}
+    # bound once, each parameter then costs at most one probe into each dict
+    kwargs_get = kwargs.get
+    config_get = flat_config.get
+
+    for name, default, config_key in params:
+        val = kwargs_get(name)
+
+        if val is None:  # Config option, then default fallback
+            val = config_get(config_key, default)
+
+        final_args[name] = val
+
+    return final_args
+
+
+# (name, "section:name") pairs -> compiled code of the generated merge function
+_CODE_CACHE: dict[tuple, object] = {}
+
+
+def _compile_merge(params):
+    """
+    _merge_args unrolled for one command: the source is generated with one
+    straight-line lookup per parameter and exec'd, so a call runs no loop.
+    Defaults are handed in as globals rather than written into the source.
+    Returns None if generation fails, callers then use _merge_args
+    """
+    key = tuple((name, config_key) for name, _, config_key in params)
+    try:
+        code = _CODE_CACHE.get(key)
+        if code is None:
+            lines = [
+                "def _merged(kwargs, flat_config):",
+                "    kwargs_get = kwargs.get",
+                "    config_get = flat_config.get",
+            ]
+            for i, (name, config_key) in enumerate(key):
+                lines.append(f"    v{i} = kwargs_get({name!r})")
+                lines.append(f"    if v{i} is None:")
+                lines.append(f"        v{i} = config_get({config_key!r}, _d{i})")
+            fields = ", ".join(f"{name!r}: v{i}" for i, (name, _) in enumerate(key))
+            lines.append(f"    return {{{fields}}}")
+            code = compile("\n".join(lines), "<merge>", "exec")
+            _CODE_CACHE[key] = code
+
+        namespace = {f"_d{i}": default for i, (_, default, _) in enumerate(params)}
+        # the source is built only from parameter identifiers and repr()'d config keys
+        exec(code, namespace)  # noqa: S102
+        return namespace["_merged"]
+    except (SyntaxError, ValueError):
+        return None
+
+
+def merge(section: str | None = None, loader: Callable[[], Mapping] | None = None):
     """
     Decorator to merge the func call arguments/options of Typer with config defaults provided via TOML tables.
     The precedence is as follows:
@@ -20,62 +145,45 @@ def merge(section: str | None = None):
             i.e.
             def name(option: typer.Option('-x', '--flag') = <value>, ...):
         )
+
+    loader returns the config flattened to {"section:param": value} (see
+    config.flatten) and is called when the command runs, without one the decorated
+    function's module level config_data is flattened on each call.
     """
 
     def decorator(func):
-        orig_sig = inspect.signature(func)
-        declared_defaults = {
-            name: param.default
-            for name, param in orig_sig.parameters.items()
-            if param.default is not inspect._empty
-        }
-
-        # Modded signature with defaults set to None for Typer to see as optional; leaves *args, **kwargs, and positional-only params default
-        new_params = []
-        for param in orig_sig.parameters.values():
-            if param.kind in (
-                inspect.Parameter.VAR_POSITIONAL,
-                inspect.Parameter.VAR_KEYWORD,
-                inspect.Parameter.POSITIONAL_ONLY,
-            ):
-                new_params.append(param)
-            else:
-                new_params.append(param.replace(default=None))
-        new_sig = orig_sig.replace(parameters=new_params)
+        names, declared_defaults, new_sig = _fast_sig(func) or _inspect_sig(func)
+
+        # (name, default, "section:name") resolved once here, so a call is one
+        # dict lookup per parameter
+        section_key = section or func.__name__
+        params = tuple(
+            (name, declared_defaults.get(name), f"{section_key}:{name}")
+            for name in names
+        )
+        func_globals = func.__globals__
+        merged = _compile_merge(params) or (
+            lambda kwargs, flat_config: _merge_args(params, kwargs, flat_config)
+        )
 
         # Actual wrapper lets go
-        @wraps(func)
         def wrapper(*args, **kwargs):
-            config_data = func.__globals__.get("config_data", {})
-
-            section_key = section or func.__name__
-            config_section = (
-                config_data.get(section_key, {})
-                if isinstance(config_data, dict)
-                else {}
-            )
-
-            bound = orig_sig.bind_partial(*args, **kwargs)
-            final_args = {}
-
-            for name in orig_sig.parameters:
-                val = bound.arguments.get(name, None)
-
-                if val is not None:  # Explicit cli option
-                    final_args[name] = val
-                    continue
-
-                if name in config_section:  # Config option
-                    final_args[name] = config_section[name]
-                    continue
+            # loader is only called once a command actually runs
+            if loader is not None:
+                flat_config = loader()
+            else:
+                flat_config = flatten(func_globals.get("config_data", {}))
 
-                if name in declared_defaults:  # Default fallback
-                    final_args[name] = declared_defaults[name]
-                else:
-                    final_args[name] = None
+            # Typer passes everything as keywords, positionals only come from direct calls
+            if args:
+                kwargs = {**dict(zip(names, args)), **kwargs}
 
-            return func(**final_args)
+            return func(**merged(kwargs, flat_config))
 
+        # all Typer reads off the command is its name, help text and signature
+        wrapper.__name__ = func.__name__
+        wrapper.__qualname__ = func.__qualname__
+        wrapper.__doc__ = func.__doc__
         wrapper.__signature__ = new_sig
         return wrapper
 
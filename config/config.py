@@ -1,13 +1,21 @@
-import tomllib
-import tomli_w
+import os
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
-PATH = Path("config/config.toml")
+# rtoml parses in native code when it's installed, tomllib is always there
+try:
+    from rtoml import loads as _loads
+except ImportError:
+    from tomllib import loads as _loads
 
-DEFAULT_DATA = {
+# next to this module and resolved once, so it doesn't depend on the working directory
+PATH = Path(__file__).resolve().with_name("config.toml")
+
+_DEFAULTS = {
     "console": {"force_color": True},
     "monitor": {
-        "monitor": 5,
+        "process": 5,
         "load": True,
         "cpu": True,
         "ram": True,
@@ -19,24 +27,56 @@ DEFAULT_DATA = {
     "ai": {"format": "hybrid", "verbosity": "normal", "auto_fix": False},
 }
 
+# read-only so callers handed the defaults can't change them for everyone else
+DEFAULT_DATA = MappingProxyType(
+    {section: MappingProxyType(values) for section, values in _DEFAULTS.items()}
+)
+
+
+def flatten(data: Mapping) -> dict:
+    """
+    {"section": {"param": value}} -> {"section:param": value}, so a config value is
+    found with one lookup. Top level values that aren't tables are left out
+    """
+    if not isinstance(data, Mapping):
+        return {}
+
+    return {
+        f"{section}:{param}": value
+        for section, table in data.items()
+        if isinstance(table, Mapping)
+        for param, value in table.items()
+    }
+
 
 def create_config_file(path: Path) -> None:
+    # only needed the first time, kept off the import path of every command
+    import tomli_w
+
     try:
         with open(path, "wb") as config:
             tomli_w.dump(DEFAULT_DATA, config)
-            print(f"Created config file at {Path.home()}")
+            print(f"Created config file at {path}")
     except Exception as e:
         print(f"Could not create config.toml file: {e}")
 
 
-def load_config_file(path: Path) -> dict:
-    if not path.exists():
+def load_config_file(path: Path) -> Mapping:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
         print("Config file does not exist, creating new config file...")
         create_config_file(path)
         return DEFAULT_DATA
 
-    with open(path, "rb") as config:
-        data = tomllib.load(config)
+    # open + fstat + one pread, no buffered file object for a file this small.
+    # Not cached here, cli.app's get_config already loads it once per process
+    try:
+        raw = os.pread(fd, os.fstat(fd).st_size, 0)
+    finally:
+        os.close(fd)
+
+    data = _loads(raw.decode())
 
     if not data:
         print("Config file is empty, creating new config file...")
@@ -50,8 +90,7 @@ if __name__ == "__main__":
     """
     Run this file for a default config.toml file
     """
-    try:
-        load_config_file(PATH)
-        print(f"Loaded config file at {PATH}")
-    except Exception:
-        create_config_file()
+    if not PATH.exists():
+        create_config_file(PATH)
+    load_config_file(PATH)
+    print(f"Loaded config file at {PATH}")
@@ -0,0 +1,267 @@
+import io
+import signal
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from cli.ai import ai_monitor
+
+
+def _snapshot(load, used, total=1000, disk=50.0, cores=2):
+    return ai_monitor.SystemSnapshot(
+        load_avg=load,
+        cpu_cores=cores,
+        memory_db={"total": total, "used": used, "free": total - used},
+        disk_usage_percent=disk,
+    )
+
+
+class TestFormatResponse:
+    def _monitor(self, verbosity):
+        monitor = ai_monitor.AIMonitor.__new__(ai_monitor.AIMonitor)
+        monitor.verbosity = verbosity
+        monitor.data_format = ai_monitor.DataFormat.HYBRID
+        return monitor
+
+    def test_concise_keeps_first_three_marked_lines(self):
+        response = "\n".join(
+            [
+                "SUMMARY: disk almost full",
+                "ISSUES:",
+                "- /var is at 97%",
+                "CRITICAL: logrotate is not running",
+                "ACTION: sudo systemctl start logrotate",
+                "ACTION: sudo journalctl --vacuum-size=200M",
+            ]
+        )
+        monitor = self._monitor(ai_monitor.Verbosity.CONCISE)
+        assert monitor._format_response(response).splitlines() == [
+            "SUMMARY: disk almost full",
+            "CRITICAL: logrotate is not running",
+            "ACTION: sudo systemctl start logrotate",
+        ]
+
+    def test_normal_returns_response_unchanged(self):
+        monitor = self._monitor(ai_monitor.Verbosity.NORMAL)
+        assert monitor._format_response("SUMMARY: ok\n") == "SUMMARY: ok\n"
+
+
+class TestRunCmds:
+    def test_outputs_in_order(self):
+        outputs = ai_monitor.MetricCollector.run_cmds(["echo first", "echo second"])
+        assert outputs == ["first", "second"]
+
+    def test_missing_command_and_timeout_give_empty(self):
+        outputs = ai_monitor.MetricCollector.run_cmds(
+            ["surge-no-such-command", "sleep 5", "echo ok"], timeout=0.2
+        )
+        assert outputs == ["", "", "ok"]
+
+    def test_collect_uses_the_monitor_getters(self, monkeypatch):
+        collector = ai_monitor.MetricCollector()
+        monkeypatch.setattr(ai_monitor.app, "get_load", lambda: ([1.0, 2.0, 3.0], 4))
+        monkeypatch.setattr(ai_monitor.app, "get_memory", lambda: (1000, 400, 100))
+        monkeypatch.setattr(ai_monitor.app, "get_disk", lambda: (10, 5, 5, 50.0))
+        monkeypatch.setattr(collector, "load_cached", lambda include_raw: None)
+        monkeypatch.setattr(collector, "save_cached", lambda snap, include_raw: None)
+
+        assert collector.collect() == ai_monitor.SystemSnapshot(
+            load_avg=[1.0, 2.0, 3.0],
+            cpu_cores=4,
+            memory_db={"total": 1000, "used": 400, "free": 100},
+            disk_usage_percent=50.0,
+        )
+
+    def test_collect_async_runs_raw_cmds_together(self, monkeypatch):
+        collector = ai_monitor.MetricCollector()
+        batches = []
+
+        def fake_run_cmds(cmds, timeout=5):
+            batches.append(list(cmds))
+            return ["up", "free", "df", "top"]
+
+        monkeypatch.setattr(collector, "run_cmds", fake_run_cmds)
+        monkeypatch.setattr(collector, "collect", lambda: _snapshot([1.0] * 3, used=1))
+        monkeypatch.setattr(collector, "load_cached", lambda include_raw: None)
+        monkeypatch.setattr(collector, "save_cached", lambda snap, include_raw: None)
+
+        snapshot = ai_monitor.asyncio.run(collector.collect_async(include_raw=True))
+        assert batches == [ai_monitor.MetricCollector.RAW_CMDS]
+        assert (snapshot.raw_uptime, snapshot.raw_top) == ("up", "top")
+
+
+class TestSnapshotCache:
+    def test_round_trip(self, monkeypatch, tmp_path):
+        collector = ai_monitor.MetricCollector()
+        path = tmp_path / "snapshot.json"
+        monkeypatch.setattr(collector, "cache_path", lambda include_raw: path)
+
+        collector.save_cached(_snapshot([1.0, 1.0, 1.0], used=200), False)
+        assert collector.load_cached(False) == _snapshot([1.0, 1.0, 1.0], used=200)
+
+    def test_file_owned_by_another_user_is_ignored(self, monkeypatch, tmp_path):
+        collector = ai_monitor.MetricCollector()
+        path = tmp_path / "snapshot.json"
+        monkeypatch.setattr(collector, "cache_path", lambda include_raw: path)
+
+        collector.save_cached(_snapshot([1.0, 1.0, 1.0], used=200), False)
+        monkeypatch.setattr(ai_monitor.os, "getuid", lambda: os.stat(path).st_uid + 1)
+        assert collector.load_cached(False) is None
+
+    def test_failed_replace_removes_temp_file(self, monkeypatch, tmp_path):
+        collector = ai_monitor.MetricCollector()
+        path = tmp_path / "snapshot.json"
+        monkeypatch.setattr(collector, "cache_path", lambda include_raw: path)
+
+        def refuse(src, dst):
+            raise PermissionError("not the owner")
+
+        monkeypatch.setattr(ai_monitor.os, "replace", refuse)
+        collector.save_cached(_snapshot([1.0, 1.0, 1.0], used=200), False)
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestCommandExecutor:
+    def test_diagnostics_match_leading_argv(self):
+        executor = ai_monitor.CommandExecutor(ai_monitor.Console(quiet=True))
+        assert executor.is_diagnostic_command("df -h")
+        assert executor.is_diagnostic_command("systemctl status nginx")
+        assert executor.is_diagnostic_command("journalctl -u nginx --since today")
+
+    def test_commands_only_containing_a_diagnostic_are_not_diagnostics(self):
+        executor = ai_monitor.CommandExecutor(ai_monitor.Console(quiet=True))
+        for cmd in (
+            "sudo rm -rf /srv/dfs",
+            "sudo df -h",
+            "sysctl vm.freepages=1",
+            "umount /mnt/dfs-share",
+            "systemctl restart nginx",
+            "journalctl --vacuum-size=200M",
+            "journalctl --rotate",
+            "dfx",
+            "df 'unterminated",
+        ):
+            assert not executor.is_diagnostic_command(cmd), cmd
+
+    def test_execute_returns_output(self):
+        executor = ai_monitor.CommandExecutor(ai_monitor.Console(quiet=True))
+        assert ai_monitor.asyncio.run(executor.execute("echo hi", False)) == (
+            True,
+            "hi\n",
+        )
+
+    def test_cancelled_command_is_killed(self, monkeypatch):
+        asyncio = ai_monitor.asyncio
+        executor = ai_monitor.CommandExecutor(ai_monitor.Console(quiet=True))
+        procs = []
+        spawn = asyncio.create_subprocess_exec
+
+        async def recording_spawn(*args, **kwargs):
+            procs.append(await spawn(*args, **kwargs))
+            return procs[-1]
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", recording_spawn)
+
+        async def cancel_soon():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(executor.execute("sleep 5", False), 0.2)
+
+        start = time.monotonic()
+        asyncio.run(cancel_soon())
+        assert time.monotonic() - start < 2
+        assert procs[0].returncode == -signal.SIGKILL
+
+
+class TestRunFixes:
+    def test_parse_selection(self):
+        parse = ai_monitor.AIMonitor.parse_selection
+        assert parse("all", 3) == {1, 2, 3}
+        assert parse("none", 3) == set()
+        assert parse("1, 3", 3) == {1, 3}
+        assert parse("4", 3) is None
+        assert parse("yes", 3) is None
+
+    def test_only_picked_fixes_run(self, monkeypatch):
+        monitor = ai_monitor.AIMonitor.__new__(ai_monitor.AIMonitor)
+        monitor.console = ai_monitor.Console(quiet=True)
+        monitor.executor = ai_monitor.CommandExecutor(monitor.console)
+        executed = []
+
+        async def fake_execute(cmd, require_confirm=True):
+            executed.append(cmd)
+            return True, "done"
+
+        monkeypatch.setattr(monitor.executor, "execute", fake_execute)
+        asked = []
+
+        def pick_first_and_third(count):
+            asked.append(count)
+            return {1, 3}
+
+        monkeypatch.setattr(monitor, "_ask_selection", pick_first_and_third)
+
+        commands = [
+            "sudo apt clean",
+            "df -h",
+            "sudo journalctl --vacuum-size=200M",
+            "sudo systemctl restart nginx",
+        ]
+        results = ai_monitor.asyncio.run(monitor.run_fixes(commands))
+
+        # three fixes offered in one prompt, fixes 1 and 3 picked, 2 skipped
+        assert asked == [3]
+        assert sorted(executed) == [
+            "df -h",
+            "sudo apt clean",
+            "sudo systemctl restart nginx",
+        ]
+        assert [r["command"] for r in results] == commands
+        assert results[2]["output"] == "Skipped by user"
+        assert [r["output"] for r in results if r["output"] != "Skipped by user"] == [
+            "done"
+        ] * 3
+
+    def test_diagnostics_are_listed_and_lookalikes_need_picking(self, monkeypatch):
+        monitor = ai_monitor.AIMonitor.__new__(ai_monitor.AIMonitor)
+        monitor.console = ai_monitor.Console(file=io.StringIO(), width=120)
+        monitor.executor = ai_monitor.CommandExecutor(monitor.console)
+        executed = []
+
+        async def fake_execute(cmd, require_confirm=True):
+            executed.append(cmd)
+            return True, "done"
+
+        monkeypatch.setattr(monitor.executor, "execute", fake_execute)
+        monkeypatch.setattr(monitor, "_ask_selection", lambda count: set())
+
+        commands = ["df -h", "sudo rm -rf /srv/dfs"]
+        ai_monitor.asyncio.run(monitor.run_fixes(commands))
+
+        assert executed == ["df -h"]
+        out = monitor.console.file.getvalue()
+        assert out.index("df -h") < out.index("sudo rm -rf /srv/dfs")
+        assert "Read-only diagnostics" in out
+
+    def test_interrupt_at_the_prompt_propagates(self, monkeypatch):
+        monitor = ai_monitor.AIMonitor.__new__(ai_monitor.AIMonitor)
+        monitor.console = ai_monitor.Console(quiet=True)
+        monitor.executor = ai_monitor.CommandExecutor(monitor.console)
+        executed = []
+
+        async def fake_execute(cmd, require_confirm=True):
+            executed.append(cmd)
+            return True, "done"
+
+        def interrupt(count):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(monitor.executor, "execute", fake_execute)
+        monkeypatch.setattr(monitor, "_ask_selection", interrupt)
+
+        with pytest.raises(KeyboardInterrupt):
+            ai_monitor.asyncio.run(monitor.run_fixes(["df -h", "sudo apt clean"]))
+        assert executed == []
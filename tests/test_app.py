@@ -8,45 +8,164 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import cli.app as app_mod
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner():
+    # invoke() sets up fresh streams per call, so one runner serves every test
     return CliRunner()
 
 
+@pytest.fixture(autouse=True)
+def clear_getter_caches():
+    for getter in (
+        app_mod.get_load,
+        app_mod.get_cpu,
+        app_mod.get_memory,
+        app_mod.get_disk,
+    ):
+        getter.cache_clear()
+    app_mod._cores.cache_clear()
+    app_mod.get_io.cache_clear()
+    app_mod._last_diskstats = None
+
+
 def _side_effect_sequence(responses):
-    iterator = iter(responses)
+    nx = iter(responses).__next__
+    return lambda *args, **kwargs: nx()
+
 
-    def _fn(*args, **kwargs):
-        return next(iterator)
+def _fake_proc(files):
+    def _fn(path):
+        return files[path]
 
     return _fn
 
 
 class TestHelpers:
-    def test_get_load_parses_values(self, monkeypatch):
-        monkeypatch.setattr(
-            app_mod, "run_cmd", _side_effect_sequence(["0.10, 0.20, 0.30", "8"])
+    @pytest.mark.parametrize(
+        "getter, proc, patches, expected",
+        [
+            pytest.param(
+                "get_load",
+                {"/proc/loadavg": b"0.10 0.20 0.30 1/123 4567\n"},
+                [(os, "sched_getaffinity", lambda pid: set(range(8)))],
+                ([0.10, 0.20, 0.30], 8),
+                id="load",
+            ),
+            pytest.param(
+                "get_cpu",
+                # /proc/stat is read twice, before and after the sleep
+                [
+                    b"cpu  100 0 100 800 0 0 0 0 0 0\ncpu0 1 2 3 4\n",
+                    b"cpu  110 0 140 1150 0 0 0 0 0 0\ncpu0 1 2 3 4\n",
+                ],
+                [(app_mod.time, "sleep", lambda _: None)],
+                (2.5, 10.0, 87.5),
+                id="cpu",
+            ),
+            pytest.param(
+                "get_memory",
+                {
+                    "/proc/meminfo": b"MemTotal:         782336 kB\n"
+                    b"MemFree:          147456 kB\n"
+                    b"MemAvailable:     278528 kB\n"
+                    b"Buffers:           10240 kB\n"
+                },
+                [],
+                (764, 492, 144),
+                id="memory",
+            ),
+            pytest.param(
+                "get_disk",
+                None,
+                [
+                    (
+                        os,
+                        "statvfs",
+                        lambda _: os.statvfs_result(
+                            (4096, 4096, 25, 10, 5, 0, 0, 0, 0, 255)
+                        ),
+                    )
+                ],
+                (102400, 61440, 20480, 75.0),
+                id="disk",
+            ),
+        ],
+    )
+    def test_getters_parse_values(self, monkeypatch, getter, proc, patches, expected):
+        if isinstance(proc, dict):
+            monkeypatch.setattr(app_mod, "read_proc", _fake_proc(proc))
+        elif proc is not None:
+            monkeypatch.setattr(app_mod, "read_proc", _side_effect_sequence(proc))
+        for target, name, value in patches:
+            monkeypatch.setattr(target, name, value)
+        assert tuple(getattr(app_mod, getter)()) == expected
+
+    def test_getters_are_cached_within_ttl(self, monkeypatch):
+        reads = []
+
+        def fake_read(path):
+            reads.append(path)
+            return b"0.10 0.20 0.30 1/123 4567\n"
+
+        monkeypatch.setattr(app_mod, "read_proc", fake_read)
+        monkeypatch.setattr(app_mod.os, "sched_getaffinity", lambda pid: set(range(8)))
+        assert app_mod.get_load() == app_mod.get_load()
+        assert reads == ["/proc/loadavg"]
+
+        monkeypatch.setattr(app_mod.get_load, "ttl", 0)
+        app_mod.get_load.cache_clear()
+        app_mod.get_load()
+        app_mod.get_load()
+        assert len(reads) == 3
+
+    def test_run_argv_skips_missing_tools(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("subprocess started for a missing tool")
+
+        monkeypatch.setattr(app_mod, "which", lambda name: None)
+        monkeypatch.setattr(app_mod.subprocess, "Popen", fail)
+        assert app_mod.run_argv(["traceroute", "example.com"]) == ""
+
+    def test_get_top_processes_falls_back_to_ps(self, monkeypatch):
+        def no_psutil():
+            raise ImportError
+
+        ps = (
+            "USER PID %CPU %MEM COMMAND\n"
+            "root 1 0.1 2.0 init\n"
+            "root 2 5.0 0.5 python app.py\n"
         )
-        averages, cores = app_mod.get_load()
-        assert (averages, cores) == ([0.10, 0.20, 0.30], 8.0)
-
-    def test_get_cpu_parses_values(self, monkeypatch):
-        cpu_line = "%Cpu(s):  0.0 us,  4.8 sy,  0.0 ni, 95.2 id,  0.0 wa,  0.0 hi,  0.0 si,  0.0 st"
-        monkeypatch.setattr(app_mod, "run_cmd", lambda *_, **__: cpu_line)
-        user, system, idle = app_mod.get_cpu()
-        assert (user, system, idle) == ("0.0", "4.8", "95.2")
-
-    def test_get_memory_parses_values(self, monkeypatch):
-        mem_line = "Mem: 764 492 144 8 247 272"
-        monkeypatch.setattr(app_mod, "run_cmd", lambda *_, **__: mem_line)
-        total, used, free_mem = app_mod.get_memory()
-        assert (total, used, free_mem) == ("764", "492", "144")
-
-    def test_get_disk_parses_values(self, monkeypatch):
-        df_line = "/dev/vda1 25G 5.2G 20G 21% /"
-        monkeypatch.setattr(app_mod, "run_cmd", lambda *_, **__: df_line)
-        size, used, available, percent = app_mod.get_disk()
-        assert (size, used, available, percent) == ("25G", "5.2G", "20G", "21%")
+        monkeypatch.setattr(app_mod, "_ps_psutil", no_psutil)
+        monkeypatch.setattr(app_mod, "run_argv", lambda argv: ps)
+        top_cpu, top_mem = app_mod.get_top_processes(1)
+        assert [p["COMMAND"] for p in top_cpu] == ["python app.py"]
+        assert [p["COMMAND"] for p in top_mem] == ["init"]
+
+    def test_get_io_rates(self, monkeypatch):
+        diskstats = [
+            b"   8  0 sda 100 0 2048 0 50 0 1024 0 0 0 0\n   8  1 sda1 1 0 2 0 1 0 2 0 0 0 0\n",
+            b"   8  0 sda 110 0 2248 0 70 0 1224 0 0 0 0\n   8  1 sda1 1 0 2 0 1 0 2 0 0 0 0\n",
+        ]
+        files = iter([diskstats[0], b"10.00 5.00\n", diskstats[1]])
+        monkeypatch.setattr(app_mod, "read_proc", lambda path: next(files))
+        monkeypatch.setattr(app_mod, "_whole_disks", lambda: frozenset({"sda"}))
+        clock = iter([100.0, 100.0, 102.0, 102.0])
+        monkeypatch.setattr(app_mod.time, "monotonic", lambda: next(clock))
+
+        # since boot: 100 reads, 50 writes over 10s of uptime
+        assert app_mod.get_io() == {"sda": (10.0, 5.0, 102.4, 51.2)}
+        app_mod.get_io.cache_clear()
+        # then deltas over the 2s between calls
+        assert app_mod.get_io() == {"sda": (5.0, 10.0, 50.0, 50.0)}
+
+    def test_take_snapshot_only_collects_requested(self, monkeypatch):
+        monkeypatch.setattr(app_mod, "get_memory", lambda: (100, 40, 60))
+        snap = app_mod.take_snapshot(load=False, cpu=False, ram=True, disk=False)
+        assert snap == app_mod.MetricsSnapshot(memory=(100, 40, 60))
+
+    def test_format_bytes(self):
+        assert app_mod.format_bytes(512) == "512.0B"
+        assert app_mod.format_bytes(5.2 * 1024**3) == "5.2G"
 
 
 class TestCLI:
@@ -61,6 +180,12 @@ class TestCLI:
         else:
             assert isinstance(result.exception, SystemExit)
 
+    def test_help_does_not_load_config(self, runner):
+        app_mod.get_config.cache_clear()
+        result = runner.invoke(app_mod.app, ["--help"], catch_exceptions=False)
+        assert result.exit_code == 0
+        assert app_mod.get_config.cache_info().misses == 0
+
     def test_monitor_unknown_option_errors(self, runner):
         result = runner.invoke(app_mod.app, ["monitor", "--not-a-real-flag"])
         assert result.exit_code != 0
@@ -73,6 +198,37 @@ class TestCLI:
         assert isinstance(result.exception, SystemExit)
         assert result.exit_code == 2
 
+    def test_monitor_interval_polls(self, monkeypatch, runner):
+        calls = []
+
+        async def fake_poll(interval, wanted, verbose):
+            calls.append((interval, wanted["process"]))
+
+        for getter in (
+            app_mod.get_cpu,
+            app_mod.get_memory,
+            app_mod.get_disk,
+            app_mod.get_io,
+        ):
+            monkeypatch.setattr(getter, "ttl", getter.ttl)
+        monkeypatch.setattr(app_mod, "poll_dashboard", fake_poll)
+        result = runner.invoke(
+            app_mod.app, ["monitor", "-i", "0.5", "-p", "3"], catch_exceptions=False
+        )
+        assert result.exit_code == 0
+        assert calls == [(0.5, 3)]
+        assert app_mod.get_cpu.ttl == 0.25
+
+    def test_render_dashboard_skips_missing_metrics(self):
+        snap = app_mod.MetricsSnapshot(cpu=(10.0, 5.0, 85.0))
+        from rich.console import Console
+
+        console = Console(record=True, width=120)
+        console.print(app_mod.render_dashboard(snap))
+        text = console.export_text()
+        assert "CPU Usage" in text
+        assert "Memory Usage" not in text
+
     def test_monitor_invalid_interval_errors(self, runner):
         result = runner.invoke(app_mod.app, ["monitor", "--interval", "-5"])
         assert result.exit_code != 0
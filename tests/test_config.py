@@ -0,0 +1,37 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import config
+
+
+class TestLoadConfigFile:
+    def test_reads_the_file_as_it_is_now(self, tmp_path):
+        path = tmp_path / "config.toml"
+        path.write_text('[network]\ndtype = "A"\n')
+        first = config.load_config_file(path)
+        assert first["network"]["dtype"] == "A"
+
+        path.write_text('[network]\ndtype = "MX"\n')
+        assert config.load_config_file(path)["network"]["dtype"] == "MX"
+        # every call gets its own dict
+        assert first["network"]["dtype"] == "A"
+
+    def test_missing_file_creates_defaults(self, tmp_path):
+        path = tmp_path / "config.toml"
+        data = config.load_config_file(path)
+        assert data["network"]["dtype"] == "A"
+        assert path.exists()
+
+
+class TestDefaults:
+    def test_defaults_are_read_only(self):
+        import pytest
+
+        with pytest.raises(TypeError):
+            config.DEFAULT_DATA["monitor"]["process"] = 10
+
+    def test_monitor_defaults_match_its_options(self):
+        assert config.DEFAULT_DATA["monitor"]["process"] == 5
+        assert "monitor" not in config.DEFAULT_DATA["monitor"]
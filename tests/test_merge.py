@@ -0,0 +1,71 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cli.merge import merge
+
+
+def _command(loader):
+    @merge(loader=loader)
+    def command(count: int = 5, name: str = "default", flag: bool = False):
+        return count, name, flag
+
+    return command
+
+
+class TestMerge:
+    def test_cli_args_win_over_config_and_defaults(self):
+        command = _command(lambda: {"command:count": 9, "command:name": "config"})
+        assert command(count=1, name=None, flag=None) == (1, "config", False)
+
+    def test_defaults_fill_in_without_config(self):
+        command = _command(lambda: {})
+        assert command(count=None, name=None, flag=None) == (5, "default", False)
+
+    def test_positional_arguments_are_bound(self):
+        command = _command(lambda: {"command:flag": True})
+        assert command(2, "cli") == (2, "cli", True)
+
+    def test_typer_sees_every_option_as_optional(self):
+        import inspect
+
+        command = _command(lambda: {})
+        params = inspect.signature(command).parameters.values()
+        assert all(param.default is None for param in params)
+
+    def test_flatten_skips_non_tables(self):
+        from types import MappingProxyType
+
+        from config.config import flatten
+
+        cfg = {"command": MappingProxyType({"count": 7}), "version": 1}
+        assert flatten(cfg) == {"command:count": 7}
+
+    def test_fast_signature_matches_inspect(self):
+        from cli import merge as merge_mod
+
+        def command(count: int = 5, *, name: str = "x", flag: bool = False) -> None:
+            pass
+
+        assert merge_mod._fast_sig(command) == merge_mod._inspect_sig(command)
+
+    def test_var_args_fall_back_to_inspect(self):
+        from cli import merge as merge_mod
+
+        def command(*args, count: int = 5):
+            pass
+
+        assert merge_mod._fast_sig(command) is None
+
+    def test_compiled_merge_matches_merge_args(self):
+        from cli import merge as merge_mod
+
+        params = (("count", 5, "command:count"), ("name", "x", "command:name"))
+        merged = merge_mod._compile_merge(params)
+        for kwargs, cfg in (
+            ({"count": None, "name": None}, {}),
+            ({"count": 1, "name": None}, {"command:name": "config"}),
+            ({}, {"command:count": 9}),
+        ):
+            assert merged(kwargs, cfg) == merge_mod._merge_args(params, kwargs, cfg)
@@ -1,56 +1,84 @@
+import sys
+import types
+
 import click
+import pytest
 from typer.testing import CliRunner
 
 import cli.app as appmod
 
 runner = CliRunner()
 
+# the real library paths, taken before no_network_libs swaps them out
+real_icmp_ping = appmod.icmp_ping
+real_icmp_trace = appmod.icmp_trace
+real_dns_lookup = appmod.dns_lookup
+
+
+@pytest.fixture(autouse=True)
+def no_network_libs(monkeypatch):
+    # icmplib/dnspython may be installed, keep the tests on the run_argv fallbacks
+    monkeypatch.setattr(appmod, "icmp_ping", lambda host, count: None)
+    monkeypatch.setattr(appmod, "icmp_trace", lambda host: None)
+    monkeypatch.setattr(appmod, "dns_lookup", lambda domain, dtype: None)
+
 
-def run_cmd_spy_factory():
+PING_OUTPUT = (
+    "5 packets transmitted, 5 received, 0% packet loss\n"
+    "rtt min/avg/max/mdev = 10/11/12/0.3 ms"
+)
+
+# canned output keyed by the leading argv tokens of each tool invocation
+SPY_RESPONSES = {
+    ("ping",): PING_OUTPUT,
+    ("traceroute",): "traceroute to host\n1 a\n2 b\n3 c",
+    ("mtr", "-r"): "Start: mtr report\n1. a\n2. b",
+    ("dig", "+short"): "93.184.216.34\n",
+    ("nslookup",): "Server: 8.8.8.8\nName: example.com\nAddress: 93.184.216.34\n",
+    ("ss", "-tulwn"): "Netid State  Local Address:Port  Peer Address:Port\n",
+}
+
+
+def run_argv_spy_factory():
     calls = []
+    get = SPY_RESPONSES.get
 
-    def _spy(cmd: str):
-        calls.append(cmd)
-        if cmd.startswith("ping "):
-            return "5 packets transmitted, 5 received, 0% packet loss\nrtt min/avg/max/mdev = 10/11/12/0.3 ms"
-        if cmd.startswith("traceroute "):
-            return "traceroute to host\n1 a\n2 b\n3 c"
-        if cmd.startswith("mtr -r "):
-            return "Start: mtr report\n1. a\n2. b"
-        if cmd.startswith("curl -s -o /dev/null"):
-            return "HTTP 200 | total 0.123s | connect 0.010s | ttfb 0.050s\n"
-        if cmd.startswith("curl -s -I "):
-            return "HTTP/1.1 200 OK\nServer: test\n"
-        if cmd.startswith("dig +short "):
-            return "93.184.216.34\n"
-        if cmd.startswith("nslookup "):
-            return "Server: 8.8.8.8\nName: example.com\nAddress: 93.184.216.34\n"
-        if cmd.startswith("ss -tulwn"):
-            return "Netid State  Local Address:Port  Peer Address:Port\n"
-        return ""
+    def _spy(argv: list[str]):
+        calls.append(" ".join(argv))
+        tok = tuple(argv[:2])
+        return get(tok[:1]) or get(tok) or ""
 
     _spy.calls = calls
     return _spy
 
 
+def http_probe_fake(url: str):
+    return (
+        "HTTP 200 | total 0.123s | connect 0.010s | ttfb 0.050s",
+        "HTTP/1.1 200 OK\nServer: test",
+    )
+
+
 def test_network_runs_all_sections(monkeypatch, capsys):
-    spy = run_cmd_spy_factory()
-    monkeypatch.setattr(appmod, "run_cmd", spy)
+    spy = run_argv_spy_factory()
+    monkeypatch.setattr(appmod, "run_argv", spy)
+    monkeypatch.setattr(appmod, "http_probe", http_probe_fake)
     appmod.network(
         url="http://example.com", host="1.1.1.1", domain="example.com", sockets=True
     )
     out = capsys.readouterr().out
     assert "Ping" in out
+    assert "sent=5 | loss=0% | avg_rtt_ms=11" in out
     assert "Traceroute" in out
-    assert "HTTP (curl)" in out
+    assert "HTTP" in out
     assert "DNS" in out
     assert "Sockets (ss)" in out
     assert "HTTP 200 | total" in out
 
 
 def test_empty_flags_fail_fast(monkeypatch):
-    spy = run_cmd_spy_factory()
-    monkeypatch.setattr(appmod, "run_cmd", spy)
+    spy = run_argv_spy_factory()
+    monkeypatch.setattr(appmod, "run_argv", spy)
     # url vacío debe fallar con exit_code 2 (click.exceptions.Exit)
     try:
         appmod.network(url="", host=None, domain=None, sockets=False)
@@ -60,7 +88,8 @@ def test_empty_flags_fail_fast(monkeypatch):
 
 
 def test_traceroute_then_mtr_fallback(monkeypatch, capsys):
-    def run_cmd_fake(cmd: str):
+    def run_argv_fake(argv: list[str]):
+        cmd = " ".join(argv)
         if cmd.startswith("ping "):
             return "5 packets transmitted, 5 received, 0% packet loss\nrtt min/avg/max/mdev = 10/11/12/0.3 ms"
         if cmd.startswith("traceroute "):
@@ -69,15 +98,25 @@ def test_traceroute_then_mtr_fallback(monkeypatch, capsys):
             return "Start: mtr report\n1. a\n2. b"
         return ""
 
-    monkeypatch.setattr(appmod, "run_cmd", run_cmd_fake)
+    monkeypatch.setattr(appmod, "run_argv", run_argv_fake)
     appmod.network(host="1.1.1.1")
     out = capsys.readouterr().out
     assert "mtr report" in out
 
 
+def test_dns_lookup_skips_dig(monkeypatch, capsys):
+    spy = run_argv_spy_factory()
+    monkeypatch.setattr(appmod, "run_argv", spy)
+    monkeypatch.setattr(appmod, "dns_lookup", lambda domain, dtype: "192.0.2.1")
+    appmod.network(domain="example.com")
+    assert "192.0.2.1" in capsys.readouterr().out
+    assert spy.calls == []
+
+
 def test_cli_invocation_smoke(monkeypatch):
-    spy = run_cmd_spy_factory()
-    monkeypatch.setattr(appmod, "run_cmd", spy)
+    spy = run_argv_spy_factory()
+    monkeypatch.setattr(appmod, "run_argv", spy)
+    monkeypatch.setattr(appmod, "http_probe", http_probe_fake)
     result = runner.invoke(
         appmod.app,
         [
@@ -90,6 +129,164 @@ def test_cli_invocation_smoke(monkeypatch):
             "example.com",
             "--sockets",
         ],
+        catch_exceptions=False,
     )
     assert result.exit_code == 0
-    assert "HTTP (curl)" in result.stdout
+    assert "HTTP 200 | total" in result.stdout
+
+
+def test_http_probe_against_local_server():
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(204)
+            self.send_header("Server", "test")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.handle_request)
+    thread.start()
+    try:
+        brief, headers = appmod.http_probe(
+            f"http://user:pw@127.0.0.1:{server.server_port}/"
+        )
+    finally:
+        thread.join()
+        server.server_close()
+
+    assert brief.startswith("HTTP 204 | total ")
+    assert "Server: test" in headers
+
+
+def test_http_probe_reports_errors():
+    brief, error = appmod.http_probe("http://127.0.0.1:1/", timeout=1)
+    assert brief == ""
+    assert error
+
+
+@pytest.mark.parametrize(
+    "url", ["http://a..b/", "http://127.0.0.1:notaport/", "http:///path"]
+)
+def test_http_probe_rejects_bad_urls(url):
+    brief, error = appmod.http_probe(url, timeout=1)
+    assert brief == ""
+    assert error
+
+
+class ICMPLibError(Exception):
+    pass
+
+
+class DNSException(Exception):
+    pass
+
+
+def fake_icmplib(monkeypatch, **funcs):
+    icmplib = types.ModuleType("icmplib")
+    exceptions = types.ModuleType("icmplib.exceptions")
+    exceptions.ICMPLibError = ICMPLibError
+    icmplib.exceptions = exceptions
+    for name, func in funcs.items():
+        setattr(icmplib, name, func)
+    monkeypatch.setitem(sys.modules, "icmplib", icmplib)
+    monkeypatch.setitem(sys.modules, "icmplib.exceptions", exceptions)
+
+
+def fake_dnspython(monkeypatch, resolve):
+    dns = types.ModuleType("dns")
+    dns.exception = types.ModuleType("dns.exception")
+    dns.exception.DNSException = DNSException
+    dns.resolver = types.ModuleType("dns.resolver")
+    dns.resolver.resolve = resolve
+    monkeypatch.setitem(sys.modules, "dns", dns)
+    monkeypatch.setitem(sys.modules, "dns.exception", dns.exception)
+    monkeypatch.setitem(sys.modules, "dns.resolver", dns.resolver)
+
+
+def test_icmp_ping_summarizes_icmplib_result(monkeypatch):
+    calls = []
+
+    def ping(host, **kwargs):
+        calls.append((host, kwargs["count"], kwargs["privileged"]))
+        return types.SimpleNamespace(packets_sent=4, packet_loss=0.25, avg_rtt=11.5)
+
+    fake_icmplib(monkeypatch, ping=ping)
+    assert real_icmp_ping("1.1.1.1", 4) == "sent=4 | loss=25% | avg_rtt_ms=11.500"
+    assert calls == [("1.1.1.1", 4, False)]
+
+
+def test_icmp_ping_error_falls_back_to_ping_binary(monkeypatch, capsys):
+    def ping(host, **kwargs):
+        raise ICMPLibError("socket not permitted")
+
+    fake_icmplib(monkeypatch, ping=ping, traceroute=lambda host, **kwargs: [])
+    monkeypatch.setattr(appmod, "icmp_ping", real_icmp_ping)
+    spy = run_argv_spy_factory()
+    monkeypatch.setattr(appmod, "run_argv", spy)
+    appmod.network(host="1.1.1.1", no_trace=True)
+
+    assert "sent=5 | loss=0% | avg_rtt_ms=11" in capsys.readouterr().out
+    assert spy.calls[0].startswith("ping ")
+
+
+def test_icmp_trace_formats_hops(monkeypatch):
+    hops = [
+        types.SimpleNamespace(distance=1, address="192.0.2.1", avg_rtt=0.5),
+        types.SimpleNamespace(distance=2, address="198.51.100.7", avg_rtt=12.25),
+    ]
+    fake_icmplib(monkeypatch, traceroute=lambda host, **kwargs: hops)
+    assert real_icmp_trace("1.1.1.1").splitlines() == [
+        " 1  192.0.2.1  0.500 ms",
+        " 2  198.51.100.7  12.250 ms",
+    ]
+
+
+def test_icmp_trace_error_gives_none(monkeypatch):
+    def traceroute(host, **kwargs):
+        raise PermissionError("raw sockets need root")
+
+    fake_icmplib(monkeypatch, traceroute=traceroute)
+    assert real_icmp_trace("1.1.1.1") is None
+
+
+def test_missing_libraries_give_none(monkeypatch):
+    # a None entry makes the import raise ImportError
+    for name in ("icmplib", "dns", "dns.exception", "dns.resolver"):
+        monkeypatch.setitem(sys.modules, name, None)
+    assert real_icmp_ping("1.1.1.1", 1) is None
+    assert real_icmp_trace("1.1.1.1") is None
+    assert real_dns_lookup("example.com", "A") is None
+
+
+def test_dns_lookup_joins_answers(monkeypatch):
+    calls = []
+
+    def resolve(domain, dtype, lifetime):
+        calls.append((domain, dtype))
+        return [
+            types.SimpleNamespace(to_text=lambda: "192.0.2.1"),
+            types.SimpleNamespace(to_text=lambda: "192.0.2.2"),
+        ]
+
+    fake_dnspython(monkeypatch, resolve)
+    assert real_dns_lookup("example.com", "A") == "192.0.2.1\n192.0.2.2"
+    assert calls == [("example.com", "A")]
+
+
+def test_dns_lookup_error_falls_back_to_dig(monkeypatch, capsys):
+    def resolve(domain, dtype, lifetime):
+        raise DNSException("NXDOMAIN")
+
+    fake_dnspython(monkeypatch, resolve)
+    monkeypatch.setattr(appmod, "dns_lookup", real_dns_lookup)
+    spy = run_argv_spy_factory()
+    monkeypatch.setattr(appmod, "run_argv", spy)
+    appmod.network(domain="example.com")
+
+    assert "93.184.216.34" in capsys.readouterr().out
+    assert spy.calls[0].startswith("dig +short ")